@@ -13,24 +13,32 @@ import asyncio
 import logging
 import urllib.request
 import urllib.parse
-import urllib.error
 import hashlib
+import heapq
+import tempfile
+import threading
+import uuid
 import json as _json
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from itertools import islice
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 
 from dotenv import load_dotenv
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.error import BadRequest
 from telegram.ext import (
     Application,
+    ApplicationHandlerStop,
     CallbackQueryHandler,
     CommandHandler,
     MessageHandler,
     filters,
     ContextTypes,
 )
-from notion_client import Client
+from notion_client import APIResponseError, Client
 
 # ── Cloudinary SDK (선택적 import) ──
 try:
@@ -40,6 +48,20 @@ try:
 except ImportError:
     _CLOUDINARY_AVAILABLE = False
 
+# ── Aho–Corasick 다중 패턴 매칭 (선택적 import, 없으면 이름별 부분 문자열 검사) ──
+try:
+    import ahocorasick
+    _AHOCORASICK_AVAILABLE = True
+except ImportError:
+    _AHOCORASICK_AVAILABLE = False
+
+# ── HTTP/2 (선택적 import, httpx[http2] 설치 시 Bot API 요청을 HTTP/2로 다중화) ──
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
 # 로깅 설정
 logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -78,7 +100,7 @@ def _make_cloudinary_folder(address: str = "") -> str:
     주소가 없으면 "real_estate/매물_26.03.13" 형태로 생성.
     - 최상위 폴더는 반드시 영문(real_estate) 고정 (한글 최상위 폴더 오인식 방지)
     """
-    date_str = datetime.now().strftime("%y.%m.%d")
+    date_str = time.strftime("%y.%m.%d")
     if address:
         # 폴더명에 사용 불가한 문자 제거/치환 (/ : * ? " < > | 공백)
         safe = re.sub(r'[\\/*?:"<>|]', '', address)   # 특수문자 제거
@@ -344,6 +366,62 @@ def get_property_map_url(address: str) -> Optional[str]:
     return url
 
 
+# ── 소재지(구) / 방향 후보 (짧은 고정 문자열은 정규식 대신 부분 문자열 탐색) ──
+_GU_CANDIDATES = (
+    '수성구', '달서구', '달성군', '중구', '동구', '서구', '남구', '북구',
+)
+_DIR_CANDIDATES = (
+    '남동향', '남서향', '북동향', '북서향', '남향', '북향', '동향', '서향',
+)
+
+
+def _find_first_literal(text: str, candidates: Tuple[str, ...]) -> Optional[str]:
+    """text에서 가장 앞에 나오는 후보 반환 (같은 위치면 먼저 나열된 후보 우선)"""
+    found = None
+    found_pos = len(text)
+    for cand in candidates:
+        pos = text.find(cand)
+        if pos != -1 and pos < found_pos:
+            found, found_pos = cand, pos
+    return found
+
+
+# ── 파서 대체(alternation) 정규식 (모듈 로드 시 1회 컴파일) ──
+_RE_VAT_YES = re.compile(r'부\s*별|부가세\s*별도|부가세\s*[oO]')
+_RE_VAT_NO = re.compile(r'부\s*없|부\s*[xX]|부가세\s*[xX]|부가세\s*없')
+_RE_VIOLATION_YES = re.compile(r'위반\s*[oOㅇ]|대장\s*(위반|불법|위법)')
+_RE_VIOLATION_NO = re.compile(
+    r'위반\s*[xXㅌ]|대장\s*[oOㅇ]'
+    r'|대장\s*이상\s*[무없]|대장\s*정상'
+)
+_RE_USE_1 = re.compile(
+    r'(?:제\s*)?1\s*종'
+    r'|1\s*종\s*근\s*(?:린\s*)?(?:생)?'
+    r'|근\s*생\s*1\s*종'
+    r'|근\s*린\s*1\s*종'
+)
+_RE_USE_2 = re.compile(
+    r'(?:제\s*)?2\s*종'
+    r'|2\s*종\s*근\s*(?:린\s*)?(?:생)?'
+    r'|근\s*생\s*2\s*종'
+    r'|근\s*린\s*2\s*종'
+)
+
+# 층별면적상세 표시용 층 이모지
+_FLOOR_EMOJI = {
+    '1': '1️⃣', '2': '2️⃣', '3': '3️⃣', '4': '4️⃣', '5': '5️⃣',
+    '6': '6️⃣', '7': '7️⃣', '8': '8️⃣', '9': '9️⃣', '10': '🔟'
+}
+
+# 앞쪽 구분자 제거용: 쉼표 + 유니코드 공백 전체 (정규식 [,\s]와 동일)
+_COMMA_WS = "," + "".join(
+    chr(c) for c in range(0x3001) if chr(c).isspace()
+)
+
+# 한글 금액 단위 (만원 기준)
+_KOREAN_NUM_UNITS = {'억': 10000, '천': 1000, '백': 100}
+
+
 class PropertyParser:
     """매물 정보 파싱 클래스"""
 
@@ -353,10 +431,23 @@ class PropertyParser:
     ) -> Dict[str, any]:
         """텔레그램 메시지에서 매물 정보 추출
 
+        같은 텍스트를 다시 파싱하는 경우(원본 수정, 사진 추가 등) 캐시 결과를 사용.
+        호출 측에서 수정해도 캐시가 오염되지 않도록 복사본 반환.
+
         Args:
             text: 파싱할 텍스트
             skip_address: True이면 첫 줄을 주소로 처리하지 않음 (수정 모드)
         """
+        cached = PropertyParser._parse_cached(text, skip_address)
+        return {
+            k: (list(v) if isinstance(v, list) else v)
+            for k, v in cached.items()
+        }
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_cached(text: str, skip_address: bool) -> Dict[str, any]:
+        """parse_property_info 실제 구현 (결과 dict는 캐시 공유본이므로 수정 금지)"""
 
         # 4번 섹션 다중 줄 처리 (층별 면적/용도가 다음 줄에 이어지는 경우 합치기)
         text = PropertyParser._merge_section4_lines(text.strip())
@@ -384,9 +475,9 @@ class PropertyParser:
                     data["매물_유형"] = "통상가"
             
             # 소재지(구) 추출: 중구, 동구, 서구, 남구, 북구, 수성구, 달서구, 달성군
-            구_match = re.search(r'(중구|동구|서구|남구|북구|수성구|달서구|달성군)', 주소_line)
-            if 구_match:
-                data["소재지_구"] = 구_match.group(1)
+            구 = _find_first_literal(주소_line, _GU_CANDIDATES)
+            if 구:
+                data["소재지_구"] = 구
             
             # 임대 구분: "일부" 또는 "일부분"이 있으면 🌓일부
             if re.search(r'일부(?:분)?', 주소_line):
@@ -427,9 +518,10 @@ class PropertyParser:
             if is_numbered and not line.startswith("8."):
                 in_contacts = False
 
+            # line은 이미 strip 상태 → 각 섹션은 "N." 접두사만 잘라냄
             # 1. 보증금/월세/부가세
             if line.startswith("1."):
-                content1 = re.sub(r"^1\.\s*", "", line).strip()
+                content1 = line[2:].lstrip()
                 # "/"로 보증금/월세 분리 (한글 단위 지원)
                 price_match = re.search(
                     r'([\d억천백만원\s]+?)/([\d억천백만원\s]+)',
@@ -447,11 +539,9 @@ class PropertyParser:
                     if 월세 is not None:
                         data["월세"] = 월세
                 # 부가세 판단 (부별, 부가세별도, 부가세o 등)
-                if re.search(r'부\s*별|부가세\s*별도|부가세\s*[oO]', line):
+                if _RE_VAT_YES.search(line):
                     data["부가세"] = "별도"
-                elif re.search(
-                    r'부\s*없|부\s*[xX]|부가세\s*[xX]|부가세\s*없', line
-                ):
+                elif _RE_VAT_NO.search(line):
                     data["부가세"] = "없음"
                 elif re.search(r'부가세|확인', line):
                     data["부가세"] = "확인필요"
@@ -462,11 +552,11 @@ class PropertyParser:
 
             # 2. 관리비
             elif line.startswith("2."):
-                data["관리비"] = re.sub(r"^2\.\s*", "", line).strip()
+                data["관리비"] = line[2:].lstrip()
 
             # 3. 권리금 (무권리, 권없, 권x 등)
             elif line.startswith("3."):
-                rights_fee = re.sub(r"^3\.\s*", "", line).strip()
+                rights_fee = line[2:].lstrip()
                 # "권리금/권리/권" 접두사 제거
                 # - "권리금"은 항상 제거
                 # - "권리/권"은 뒤에 숫자가 올 때만 제거
@@ -499,12 +589,13 @@ class PropertyParser:
                     if paren_memo:
                         data["권리금 메모"] = paren_memo
                     else:
-                        remaining = re.sub(
-                            r'^\d+\s*', '', rights_clean
-                        ).strip()
-                        remaining = re.sub(
-                            r'^만\s*원?\s*', '', remaining
-                        ).strip()
+                        remaining = rights_clean[num_match.end():].strip()
+                        # "만", "만원", "만 원" 단위 접두사 제거
+                        if remaining.startswith("만"):
+                            remaining = (
+                                remaining[1:].lstrip()
+                                .removeprefix("원").lstrip()
+                            )
                         if remaining:
                             data["권리금 메모"] = remaining
                 elif (
@@ -521,9 +612,7 @@ class PropertyParser:
                         r'무권리|권\s*없|권\s*[xX]|권리금\s*[xX]',
                         '', rights_text,
                     ).strip()
-                    remaining = re.sub(
-                        r'^[,\s]+', '', remaining
-                    ).strip()
+                    remaining = remaining.lstrip(_COMMA_WS)
                     if paren_memo:
                         data["권리금 메모"] = paren_memo
                     elif remaining:
@@ -535,7 +624,7 @@ class PropertyParser:
 
             # 4. 건축물용도 / 면적 (복층/통상가 지원)
             elif line.startswith("4."):
-                content4 = re.sub(r"^4\.\s*", "", line).strip()
+                content4 = line[2:].lstrip()
 
                 # 층별 구분 체크 (여러 패턴 지원)
                 # 패턴 1: "1층 계약48.43㎡ 전용48.43㎡ 14평" (기존)
@@ -601,32 +690,18 @@ class PropertyParser:
                     총_계약 = sum(info['계약'] for info in 층별_정보.values())
                     총_전용 = sum(info['전용'] for info in 층별_정보.values())
                     
-                    # 층 이모지 매핑
-                    층_이모지 = {
-                        '1': '1️⃣', '2': '2️⃣', '3': '3️⃣', '4': '4️⃣', '5': '5️⃣',
-                        '6': '6️⃣', '7': '7️⃣', '8': '8️⃣', '9': '9️⃣', '10': '🔟'
-                    }
-                    
                     # 층 번호 순서대로 정렬
                     sorted_floors = sorted(층별_정보.keys(), key=int)
-                    층별_평수_parts = []
-                    
-                    for 층 in sorted_floors:
-                        평 = 층별_정보[층]['평']
-                        # 소수점이 0이면 정수로 표시 (14.0 → 14)
-                        if 평 == int(평):
-                            평_str = str(int(평))
-                        else:
-                            평_str = str(평)
-                        
-                        # 이모지 추가 (예: 1️⃣14p, 지하1층은 "지하1층14p")
-                        기본_표시 = PropertyParser._floor_display_name(층)
-                        이모지 = 층_이모지.get(층, 기본_표시)
-                        층별_평수_parts.append(f"{이모지}{평_str}p")
-                    
+
                     data["계약면적"] = 총_계약
                     data["전용면적"] = 총_전용
-                    data["층별면적상세"] = " ".join(층별_평수_parts)
+                    # 이모지 + 평수 (예: 1️⃣14p, 지하1층은 "지하1층14p")
+                    # :g 포맷은 소수점 0을 제거 (14.0 → 14)
+                    data["층별면적상세"] = " ".join(
+                        f"{_FLOOR_EMOJI.get(층) or PropertyParser._floor_display_name(층)}"
+                        f"{층별_정보[층]['평']:g}p"
+                        for 층 in sorted_floors
+                    )
                 else:
                     # 단일 매물 면적 파싱 (단위 없이도 인식, 다양한 구분자 지원)
                     # 지원 형식:
@@ -712,7 +787,7 @@ class PropertyParser:
 
             # 5. 주차 / 화장실
             elif line.startswith("5."):
-                content5 = re.sub(r"^5\.\s*", "", line).strip()
+                content5 = line[2:].lstrip()
                 parts5 = [p.strip() for p in content5.split("/")]
 
                 parking_parts = []
@@ -789,32 +864,24 @@ class PropertyParser:
 
             # 6. 방향
             elif line.startswith("6."):
-                방향_match = re.search(
-                    r"(남향|북향|동향|서향|남동향|남서향|북동향|북서향)", line
-                )
-                if 방향_match:
-                    data["방향"] = 방향_match.group(1)
+                방향 = _find_first_literal(line, _DIR_CANDIDATES)
+                if 방향:
+                    data["방향"] = 방향
 
             # 7. 위반건축물 (대장 기반 판단)
             elif line.startswith("7."):
                 # 위반건축물O (위반 있음)
-                if re.search(
-                    r'위반\s*[oOㅇ]|대장\s*(위반|불법|위법)', line
-                ):
+                if _RE_VIOLATION_YES.search(line):
                     data["위반건축물"] = "위반건축물O"
                 # 위반건축물X (정상)
-                elif re.search(
-                    r'위반\s*[xXㅌ]|대장\s*[oOㅇ]'
-                    r'|대장\s*이상\s*[무없]|대장\s*정상',
-                    line,
-                ):
+                elif _RE_VIOLATION_NO.search(line):
                     data["위반건축물"] = "위반건축물X"
 
             # 8. 연락처 (다중: "/" 구분 또는 줄바꿈)
             elif line.startswith("8."):
                 in_contacts = True
                 contact_idx = 0
-                content = re.sub(r"^8\.\s*", "", line).strip()
+                content = line[2:].lstrip()
                 contacts = [
                     c.strip() for c in content.split("/")
                 ]
@@ -827,7 +894,7 @@ class PropertyParser:
             # 9. 상가 특징 (채광좋음, 전면넓음, 통창/통유리 등)
             elif line.startswith("9."):
                 in_contacts = False
-                content9 = re.sub(r"^9\.\s*", "", line).strip()
+                content9 = line[2:].lstrip()
                 if content9 and content9 != "해당없음":
                     # 콤마로만 분리 (슬래시는 "통창/통유리" 등 항목 내부 구분자이므로 제외)
                     features = [
@@ -918,42 +985,51 @@ class PropertyParser:
 
         total = 0
         has_unit = False
-
-        # 억 단위 (1억 = 10000만원)
-        억_match = re.search(r'(\d+)\s*억', text)
-        if 억_match:
-            total += int(억_match.group(1)) * 10000
-            has_unit = True
-
-        # 천 단위 (1천 = 1000만원)
-        천_match = re.search(r'(\d+)\s*천', text)
-        if 천_match:
-            total += int(천_match.group(1)) * 1000
-            has_unit = True
-
-        # 백 단위 (1백 = 100만원)
-        백_match = re.search(r'(\d+)\s*백', text)
-        if 백_match:
-            total += int(백_match.group(1)) * 100
-            has_unit = True
+        seen_units = set()
+        # 단위 토큰(숫자+억/천/백)과 만/원/공백을 제외하고 남은 문자
+        rest = []
+
+        i, n = 0, len(text)
+        while i < n:
+            ch = text[i]
+            if ch.isdecimal():
+                j = i + 1
+                while j < n and text[j].isdecimal():
+                    j += 1
+                k = j
+                while k < n and text[k].isspace():
+                    k += 1
+                if k < n and text[k] in _KOREAN_NUM_UNITS:
+                    # 억/천/백 단위 (같은 단위가 반복되면 첫 번째만 사용)
+                    unit_ch = text[k]
+                    if unit_ch not in seen_units:
+                        seen_units.add(unit_ch)
+                        total += int(text[i:j]) * _KOREAN_NUM_UNITS[unit_ch]
+                    has_unit = True
+                    i = k + 1
+                    continue
+                rest.append(text[i:j])
+                i = j
+                continue
+            if ch not in "만원" and not ch.isspace():
+                rest.append(ch)
+            i += 1
+
+        # 남은 문자열의 첫 숫자 덩어리
+        # 예: "1억5000" → 1*10000 + 5000 = 15000, "1300만원" → 1300
+        extra = None
+        digits = []
+        for ch in "".join(rest):
+            if ch.isdecimal():
+                digits.append(ch)
+            elif digits:
+                break
+        if digits:
+            extra = int("".join(digits))
 
         if has_unit:
-            # 단위 제거 후 남은 숫자가 있으면 더하기
-            # 예: "1억5000" → 1*10000 + 5000 = 15000
-            remaining = re.sub(r'\d+\s*[억천백]', '', text)
-            remaining = re.sub(r'[만원\s]', '', remaining).strip()
-            extra = re.search(r'(\d+)', remaining)
-            if extra:
-                total += int(extra.group(1))
-            return total
-
-        # 단순 숫자만 있는 경우 (만원/원 제거)
-        clean = re.sub(r'[만원\s]', '', text)
-        num_match = re.search(r'(\d+)', clean)
-        if num_match:
-            return int(num_match.group(1))
-
-        return None
+            return total + (extra or 0)
+        return extra
 
     @staticmethod
     def _normalize_building_use(text: str) -> str:
@@ -964,22 +1040,10 @@ class PropertyParser:
         """
         text = text.strip()
         # 1종 근린생활시설 계열 (다양한 약어 포함)
-        if re.search(
-            r'(?:제\s*)?1\s*종'
-            r'|1\s*종\s*근\s*(?:린\s*)?(?:생)?'
-            r'|근\s*생\s*1\s*종'
-            r'|근\s*린\s*1\s*종',
-            text
-        ):
+        if _RE_USE_1.search(text):
             return "제1종근린생활시설"
         # 2종 근린생활시설 계열
-        if re.search(
-            r'(?:제\s*)?2\s*종'
-            r'|2\s*종\s*근\s*(?:린\s*)?(?:생)?'
-            r'|근\s*생\s*2\s*종'
-            r'|근\s*린\s*2\s*종',
-            text
-        ):
+        if _RE_USE_2.search(text):
             return "제2종근린생활시설"
         if re.search(r'판\s*매\s*시\s*설', text):
             return "판매시설"
@@ -1109,9 +1173,13 @@ class PropertyParser:
           →
           4. 1층 1종근생 2,3층 2종근생 1층 40/40 2층 50/50 3층 30/30
         """
+        if '4.' not in text:
+            return text
+
         lines = text.split('\n')
         result = []
         in_section4 = False
+        merged = False  # 원본과 달라진 줄이 있는지 (없으면 join 생략)
 
         for line in lines:
             stripped = line.strip()
@@ -1120,6 +1188,8 @@ class PropertyParser:
             if stripped.startswith('4.'):
                 in_section4 = True
                 result.append(stripped)
+                if stripped != line:
+                    merged = True
             elif in_section4 and not is_numbered and stripped:
                 # 층/면적 패턴이 있으면 앞 줄에 이어 붙임
                 looks_like_continuation = bool(
@@ -1127,6 +1197,7 @@ class PropertyParser:
                 )
                 if looks_like_continuation and result:
                     result[-1] = result[-1] + ' ' + stripped
+                    merged = True
                 else:
                     in_section4 = False
                     result.append(line)
@@ -1135,7 +1206,131 @@ class PropertyParser:
                     in_section4 = False
                 result.append(line)
 
-        return '\n'.join(result)
+        return '\n'.join(result) if merged else text
+
+
+# 토큰별 노션 클라이언트 캐시 (공유 DB / 개인 DB가 같은 토큰이면 커넥션 재사용)
+_NOTION_CLIENTS: Dict[str, Client] = {}
+
+
+def _get_notion_client(notion_token: str) -> Client:
+    """토큰당 하나의 notion_client.Client 반환 (프로세스 내 공유)"""
+    client = _NOTION_CLIENTS.get(notion_token)
+    if client is None:
+        client = Client(auth=notion_token)
+        _NOTION_CLIENTS[notion_token] = client
+    return client
+
+
+# 초 단위 시각 문자열 캐시: [epoch 초, 등록 날짜(ISO), 거래완료 시점]
+_date_cache = [0, "", ""]
+
+
+def _now_stamps() -> Tuple[str, str]:
+    """현재 시각 문자열 (등록 날짜 ISO, 거래완료 시점) - 같은 초 안에서는 재사용"""
+    now_s = int(time.time())
+    if now_s != _date_cache[0]:
+        d = datetime.fromtimestamp(now_s)
+        _date_cache[:] = [
+            now_s,
+            d.strftime("%Y-%m-%dT%H:%M:%S+09:00"),
+            d.strftime("%Y-%m-%d %H:%M"),
+        ]
+    return _date_cache[1], _date_cache[2]
+
+
+@lru_cache(maxsize=2048)
+def _clean_pid(page_id: str) -> str:
+    """노션 페이지 ID에서 하이픈 제거 (같은 ID 반복 비교 시 캐시)"""
+    return page_id.replace("-", "")
+
+
+def _page_url(page_id: str) -> str:
+    """페이지 ID만으로 노션 URL 생성 (제목 포함 방지 → 검색 깔끔)"""
+    return f"https://www.notion.so/{_clean_pid(page_id)}"
+
+
+def _image_block(url: str) -> Dict:
+    """외부 이미지 URL → 노션 image 블록"""
+    return {
+        "object": "block",
+        "type": "image",
+        "image": {"type": "external", "external": {"url": url}},
+    }
+
+
+def _column_pair(url1: str, url2: str) -> Dict:
+    """사진 2장 → 노션 2열 column_list 블록"""
+    return {
+        "object": "block",
+        "type": "column_list",
+        "column_list": {
+            "children": [
+                {
+                    "object": "block",
+                    "type": "column",
+                    "column": {"children": [_image_block(url)]},
+                }
+                for url in (url1, url2)
+            ]
+        },
+    }
+
+
+# ── 노션 속성값 추출 (get_page_properties용, 값이 없으면 None) ──
+
+def _prop_text(prop: Dict, kind: str) -> Optional[str]:
+    """title / rich_text 첫 조각의 텍스트"""
+    arr = prop.get(kind)
+    if not arr:
+        return None
+    try:
+        return arr[0]["text"]["content"]
+    except (KeyError, TypeError):
+        return ""
+
+
+def _prop_title(prop: Dict) -> Optional[str]:
+    return _prop_text(prop, "title")
+
+
+def _prop_rich_text(prop: Dict) -> Optional[str]:
+    return _prop_text(prop, "rich_text")
+
+
+def _prop_number(prop: Dict):
+    """number (float → int 변환: 2000.0 → 2000)"""
+    val = prop.get("number")
+    if val is None:
+        return None
+    return int(val) if val == int(val) else val
+
+
+def _prop_select(prop: Dict) -> Optional[str]:
+    try:
+        return prop["select"]["name"]
+    except (KeyError, TypeError):
+        return None
+
+
+def _prop_first_name(prop: Dict) -> Optional[str]:
+    """multi_select 첫 항목 이름"""
+    try:
+        return prop["multi_select"][0]["name"]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def _prop_names(prop: Dict) -> Optional[List[str]]:
+    """multi_select 전체 이름 리스트"""
+    ms = prop.get("multi_select")
+    if not ms:
+        return None
+    return [item["name"] for item in ms if item.get("name")]
+
+
+def _prop_phone(prop: Dict) -> Optional[str]:
+    return prop.get("phone_number") or None
 
 
 class NotionUploader:
@@ -1152,9 +1347,179 @@ class NotionUploader:
         "overloaded", "temporarily",
     ]
 
+    # ── 노션 속성 매핑: {파싱 키: (노션 속성명, 최대 길이)} ──
+    # 값 변환 없이 그대로 매핑되는 필드만 등록 (특수 처리 필드는 _build_notion_properties)
+    _RICH_TEXT_MAP = {
+        "관리비": ("⚡관리비(텍스트)", None),
+        "권리금 메모": ("권리금 메모", None),
+        "층별용도": ("층별용도", 2000),
+        "층별면적상세": ("📐 층별면적상세", None),
+        "주차 메모": ("주차 메모", None),
+        "특이사항": ("📢 특이사항", 2000),
+        "연락처 메모": ("연락처 메모", None),
+        "연락처 추가메모1": ("연락처 추가메모1", None),
+        "연락처 추가메모2": ("연락처 추가메모2", None),
+        "거래완료_시점": ("거래완료 시점", None),
+    }
+    _SELECT_MAP = {
+        "부가세": ("🧾부가세 여부", None),
+        "매물_유형": ("🏢 매물 유형", None),
+        "소재지_구": ("📍소재지(구)", None),
+        "임대_구분": ("임대 구분", None),
+        "주차": ("🅿️주차", None),
+        "방향": ("📍방향", None),
+        "화장실 위치": ("🚻화장실 위치", None),
+        "화장실 수": ("🚻화장실 수", None),
+        "화장실 형태": ("🚻화장실 형태", None),
+        "위반건축물": ("🚨위반건축물", None),
+        "계약담당자": ("계약담당자", None),
+    }
+    _NUMBER_MAP = {
+        "보증금": ("💰보증금", None),
+        "월세": ("💰월세", None),
+        "계약면적": ("📐계약면적(m²)", None),
+        "전용면적": ("📐전용면적(m²)", None),
+        "telegram_chat_id": ("telegram_chat_id", None),
+        "telegram_msg_id": ("telegram_msg_id", None),
+    }
+    _PHONE_MAP = {
+        "대표 연락처": ("📞 대표 연락처", None),
+        "추가 연락처1": ("추가 연락처1", None),
+        "추가 연락처2": ("추가 연락처2", None),
+    }
+
+    # ── 노션 속성 → 파싱 키 역매핑: {노션 속성명: (파싱 키, 추출 함수)} ──
+    _PROP_EXTRACTORS = {
+        "주소 및 상호": ("주소", _prop_title),
+        "층수": ("층수", _prop_first_name),
+        "💰보증금": ("보증금", _prop_number),
+        "💰월세": ("월세", _prop_number),
+        "💎권리금": ("권리금", _prop_number),
+        "📐계약면적(m²)": ("계약면적", _prop_number),
+        "📐전용면적(m²)": ("전용면적", _prop_number),
+        "🧾부가세 여부": ("부가세", _prop_select),
+        "🅿️주차": ("주차", _prop_select),
+        "📍방향": ("방향", _prop_select),
+        "🚻화장실 위치": ("화장실 위치", _prop_select),
+        "🚻화장실 수": ("화장실 수", _prop_select),
+        "🚨위반건축물": ("위반건축물", _prop_select),
+        "🏢 매물 유형": ("매물_유형", _prop_select),
+        "📍소재지(구)": ("소재지_구", _prop_select),
+        "임대 구분": ("임대_구분", _prop_select),
+        "거래 상태": ("거래_상태", _prop_select),
+        "🏢건축물용도": ("건축물용도", _prop_names),
+        "⚡관리비(텍스트)": ("관리비", _prop_rich_text),
+        "📢 특이사항": ("특이사항", _prop_rich_text),
+        "상가 특징": ("상가_특징", _prop_names),
+        "📞 대표 연락처": ("대표 연락처", _prop_phone),
+    }
+
+    # Notion API: 요청당 children 블록 최대 개수
+    NOTION_BLOCK_LIMIT = 100
+
+    # 동기화 속성 확인이 끝난 DB ID (프로세스당 1회만 databases.update)
+    _synced_databases: set = set()
+    # 동시 페이지 생성 제한 (Notion API 평균 ~3 req/s)
+    _create_sem = asyncio.Semaphore(2)
+    # 추적 페이지 스냅샷 전체 재조회 주기 (초) - 그 사이에는 변경분만 조회
+    TRACKED_FULL_REFRESH = 24 * 60 * 60
+
     def __init__(self, notion_token: str, database_id: str):
-        self.client = Client(auth=notion_token)
+        self.client = _get_notion_client(notion_token)
         self.database_id = database_id
+        # 속성명 → 속성 ID (databases.query의 filter_properties용, 최초 사용 시 조회)
+        self._filter_prop_ids: Optional[Dict[str, str]] = None
+        # telegram_msg_id → page_id 역인덱스 (find_page_by_msg_id 캐시)
+        # + clean page_id → msg_id 집합 (아카이브 시 해당 항목만 제거)
+        # 워커 스레드(to_thread)에서 동시에 갱신되므로 쓰기는 잠금 안에서만
+        self._msg_index: Dict[int, str] = {}
+        self._page_msg_ids: Dict[str, set] = {}
+        self._msg_index_lock = threading.Lock()
+        # 추적 페이지 스냅샷 {clean page_id: page_info} + 증분 조회 기준 시각
+        self._tracked_snapshot: Dict[str, Dict] = {}
+        self._tracked_cursor: Optional[str] = None
+        self._tracked_full_at = 0.0
+        # 스냅샷 파일 (재시작 후에도 전체 재조회 없이 증분 조회로 이어감)
+        self._snapshot_file = f"tracked_pages_{_clean_pid(database_id)}.json"
+        self._snapshot_loaded = False
+        # 워커 스레드(to_thread)에서 동시에 파일 저장할 때 직렬화
+        self._snapshot_lock = threading.Lock()
+
+    # ── 추적 페이지 스냅샷 파일 I/O ──
+    def _load_tracked_snapshot(self):
+        try:
+            with open(self._snapshot_file, "r", encoding="utf-8") as f:
+                data = _json.load(f)
+            self._tracked_snapshot = {
+                _clean_pid(p["page_id"]): p for p in data["pages"]
+            }
+            self._tracked_cursor = data["cursor"]
+            self._tracked_full_at = float(data["full_at"])
+            logger.info(
+                f"추적 페이지 스냅샷 로드: {len(self._tracked_snapshot)}개"
+            )
+        except FileNotFoundError:
+            logger.info("추적 페이지 스냅샷 파일 없음, 전체 조회로 시작")
+        except Exception as e:
+            logger.warning(f"추적 페이지 스냅샷 로드 실패: {e}")
+
+    def _save_tracked_snapshot(self):
+        try:
+            with self._snapshot_lock, open(
+                self._snapshot_file, "w", encoding="utf-8"
+            ) as f:
+                _json.dump(
+                    {
+                        "cursor": self._tracked_cursor,
+                        "full_at": self._tracked_full_at,
+                        "pages": list(self._tracked_snapshot.values()),
+                    },
+                    f, ensure_ascii=False,
+                )
+        except Exception as e:
+            logger.warning(f"추적 페이지 스냅샷 저장 실패: {e}")
+
+    def _filter_properties_for(self, names: Tuple[str, ...]) -> Optional[List[str]]:
+        """databases.query 응답을 지정 속성만으로 줄이기 위한 속성 ID 목록
+
+        DB 스키마는 databases.retrieve 1회 조회 후 캐시.
+        조회 실패 또는 속성 누락 시 None (→ 필터 없이 전체 조회).
+        """
+        if self._filter_prop_ids is None:
+            try:
+                db = self.client.databases.retrieve(
+                    database_id=self.database_id
+                )
+                self._filter_prop_ids = {
+                    name: urllib.parse.unquote(prop["id"])
+                    for name, prop in db.get("properties", {}).items()
+                }
+            except Exception as e:
+                logger.warning(f"DB 속성 ID 조회 실패 (전체 조회 사용): {e}")
+                self._filter_prop_ids = {}
+        try:
+            return [self._filter_prop_ids[name] for name in names]
+        except KeyError:
+            return None
+
+    def _check_filtered_response(
+        self, response: Dict, prop_ids: Optional[List[str]], key: str
+    ) -> bool:
+        """filter_properties 적용 응답에 key 속성이 빠졌으면 필터 해제
+
+        Returns:
+            True이면 필터가 맞지 않음 → 호출 측에서 필터 없이 다시 조회
+        """
+        pages = response.get("results", [])
+        if not prop_ids or not pages:
+            return False
+        if any(key in p.get("properties", {}) for p in pages):
+            return False
+        logger.warning(
+            f"filter_properties 응답에 '{key}' 없음 → 전체 조회로 전환"
+        )
+        self._filter_prop_ids = {}
+        return True
 
     def _notion_api_call_with_retry(
         self, func, *args, max_retries: int = 3, label: str = "", **kwargs
@@ -1194,25 +1559,54 @@ class NotionUploader:
                 time.sleep(wait)
         raise last_exc
 
+    # 동기화에 필요한 Notion 속성 (ensure_sync_properties에서 생성)
+    _SYNC_PROPERTIES = {
+        "telegram_chat_id": {"number": {}},
+        "telegram_msg_id": {"number": {}},
+        # 층별 용도 상세 필드
+        "층별용도": {"rich_text": {}},
+        # 거래 완료 관련
+        "거래완료 시점": {"rich_text": {}},
+        # 계약 담당자 (select)
+        "계약담당자": {"select": {}},
+        # 상가 특징 (multi_select)
+        "상가 특징": {"multi_select": {}},
+    }
+
+    @classmethod
+    def sync_marker_path(cls, database_id: str) -> Path:
+        """속성 확인 완료 표시 파일 경로 (DB ID + 속성 목록 기준)
+
+        속성 목록이 바뀌면 파일명이 달라져 자동으로 다시 확인.
+        노션 DB를 새로 만든 경우 이 파일을 지우거나 --force-resync로 실행.
+        """
+        key = database_id + "|" + ",".join(sorted(cls._SYNC_PROPERTIES))
+        digest = hashlib.md5(key.encode("utf-8")).hexdigest()
+        return Path(tempfile.gettempdir()) / f"notion_sync_{digest}.ok"
+
     def ensure_sync_properties(self):
-        """동기화에 필요한 Notion 속성 생성 (없으면 추가)"""
+        """동기화에 필요한 Notion 속성 생성 (없으면 추가, DB당 1회)
+
+        이전 실행에서 확인을 마쳤으면 (표시 파일 존재) API 호출 생략.
+        """
+        if self.database_id in self._synced_databases:
+            return
+        marker = self.sync_marker_path(self.database_id)
+        if marker.exists():
+            self._synced_databases.add(self.database_id)
+            logger.info("동기화용 Notion 속성 확인 생략 (이전 실행에서 완료)")
+            return
         try:
             self.client.databases.update(
                 database_id=self.database_id,
-                properties={
-                    "telegram_chat_id": {"number": {}},
-                    "telegram_msg_id": {"number": {}},
-                    # 층별 용도 상세 필드
-                    "층별용도": {"rich_text": {}},
-                    # 거래 완료 관련
-                    "거래완료 시점": {"rich_text": {}},
-                    # 계약 담당자 (select)
-                    "계약담당자": {"select": {}},
-                    # 상가 특징 (multi_select)
-                    "상가 특징": {"multi_select": {}},
-                },
+                properties=self._SYNC_PROPERTIES,
             )
+            self._synced_databases.add(self.database_id)
             logger.info("동기화용 Notion 속성 확인 완료")
+            try:
+                marker.touch()
+            except OSError as e:
+                logger.warning(f"동기화 속성 표시 파일 생성 실패: {e}")
         except Exception as e:
             logger.warning(
                 f"동기화 속성 생성/확인 실패 (무시): {e}"
@@ -1227,7 +1621,37 @@ class NotionUploader:
             property_data: 파싱된 매물 정보
             is_update: True이면 수정 모드 (등록 날짜, 거래 상태 유지)
         """
-        properties = {}
+        # ── 단순 매핑 필드 (rich_text / select / number / phone_number) ──
+        # 테이블 키와 입력 키의 교집합만 순회 (존재하는 필드만)
+        keys = property_data.keys()
+        rich_text = self._RICH_TEXT_MAP
+        properties = {
+            rich_text[k][0]: {
+                "rich_text": [
+                    {
+                        "text": {
+                            "content": (
+                                property_data[k] if rich_text[k][1] is None
+                                else property_data[k][:rich_text[k][1]]
+                            )
+                        }
+                    }
+                ]
+            }
+            for k in keys & rich_text.keys()
+        }
+        properties.update({
+            self._SELECT_MAP[k][0]: {"select": {"name": property_data[k]}}
+            for k in keys & self._SELECT_MAP.keys()
+        })
+        properties.update({
+            self._NUMBER_MAP[k][0]: {"number": property_data[k]}
+            for k in keys & self._NUMBER_MAP.keys()
+        })
+        properties.update({
+            self._PHONE_MAP[k][0]: {"phone_number": property_data[k]}
+            for k in keys & self._PHONE_MAP.keys()
+        })
 
         # ── 주소 및 상호 (title) ──
         if "주소" in property_data:
@@ -1296,65 +1720,43 @@ class NotionUploader:
         주소 = property_data.get("주소", "")
         층_list = []
 
-        # 0. 지하층 우선 감지: "지하N층", "지하 N층", "-N층"
-        지하_matches = re.findall(r'(?:지하\s*|(?<!\d)-\s*)(\d+)\s*층', 주소)
-        if 지하_matches:
-            층_list = [f"지하{n}층" for n in 지하_matches]
-        else:
-            # 지하층이 없을 때만 지상층 파싱 (오탐 방지를 위해 지하 표현 제거 후 처리)
-            주소_지상 = re.sub(r'(?:지하\s*|-\s*)\d+\s*층', '', 주소)
-
-            # 1. 범위 형식 우선: "1~3층", "1-3층", "1층~4층", "1층-4층"
-            범위_match = re.search(r'(\d+)\s*층?\s*[~\-]\s*(\d+)\s*층', 주소_지상)
-            if 범위_match:
-                start = int(범위_match.group(1))
-                end = int(범위_match.group(2))
-                층_list = [f"{i}층" for i in range(start, end + 1)]
+        # "층"이 없으면 정규식 탐색 전체 생략 (수정 모드 등 빠른 거부)
+        if "층" in 주소:
+            # 0. 지하층 우선 감지: "지하N층", "지하 N층", "-N층"
+            지하_matches = re.findall(r'(?:지하\s*|(?<!\d)-\s*)(\d+)\s*층', 주소)
+            if 지하_matches:
+                층_list = [f"지하{n}층" for n in 지하_matches]
             else:
-                # 2. 콤마 구분 형식: "1,2,3층"
-                콤마_match = re.search(r'(\d+(?:,\d+)+)층', 주소_지상)
-                if 콤마_match:
-                    층_numbers = 콤마_match.group(1).split(',')
-                    층_list = [f"{층.strip()}층" for 층 in 층_numbers]
+                # 지하층이 없을 때만 지상층 파싱 (오탐 방지를 위해 지하 표현 제거 후 처리)
+                주소_지상 = re.sub(r'(?:지하\s*|-\s*)\d+\s*층', '', 주소)
+
+                # 1. 범위 형식 우선: "1~3층", "1-3층", "1층~4층", "1층-4층"
+                범위_match = re.search(r'(\d+)\s*층?\s*[~\-]\s*(\d+)\s*층', 주소_지상)
+                if 범위_match:
+                    start = int(범위_match.group(1))
+                    end = int(범위_match.group(2))
+                    층_list = [f"{i}층" for i in range(start, end + 1)]
                 else:
-                    # 3. 연속 층 형식: "2층3층" 또는 "1층 2층 3층" (띄어쓰기 0~2개)
-                    연속_matches = re.findall(r'(\d+)층', 주소_지상)
-                    if len(연속_matches) > 1:
-                        # 여러 층이 감지되면 모두 추가
-                        층_list = [f"{층}층" for 층 in 연속_matches]
-                    elif len(연속_matches) == 1:
-                        # 4. 단일 층 형식: "1층"
-                        층_list = [f"{연속_matches[0]}층"]
+                    # 2. 콤마 구분 형식: "1,2,3층"
+                    콤마_match = re.search(r'(\d+(?:,\d+)+)층', 주소_지상)
+                    if 콤마_match:
+                        층_numbers = 콤마_match.group(1).split(',')
+                        층_list = [f"{층.strip()}층" for 층 in 층_numbers]
+                    else:
+                        # 3. 연속 층 형식: "2층3층" 또는 "1층 2층 3층" (띄어쓰기 0~2개)
+                        연속_matches = re.findall(r'(\d+)층', 주소_지상)
+                        if len(연속_matches) > 1:
+                            # 여러 층이 감지되면 모두 추가
+                            층_list = [f"{층}층" for 층 in 연속_matches]
+                        elif len(연속_matches) == 1:
+                            # 4. 단일 층 형식: "1층"
+                            층_list = [f"{연속_matches[0]}층"]
 
         if 층_list:
             properties["층수"] = {
                 "multi_select": [{"name": 층} for 층 in 층_list]
             }
 
-        # ── 💰보증금 (number) ──
-        if "보증금" in property_data:
-            properties["💰보증금"] = {
-                "number": property_data["보증금"]
-            }
-
-        # ── 💰월세 (number) ──
-        if "월세" in property_data:
-            properties["💰월세"] = {"number": property_data["월세"]}
-
-        # ── 🧾부가세 여부 (select) ──
-        if "부가세" in property_data:
-            properties["🧾부가세 여부"] = {
-                "select": {"name": property_data["부가세"]}
-            }
-
-        # ── ⚡관리비(텍스트) (rich_text) ──
-        if "관리비" in property_data:
-            properties["⚡관리비(텍스트)"] = {
-                "rich_text": [
-                    {"text": {"content": property_data["관리비"]}}
-                ]
-            }
-
         # ── 💎권리금 (number) ──
         if "권리금" in property_data:
             if isinstance(property_data["권리금"], int):
@@ -1362,14 +1764,6 @@ class NotionUploader:
                     "number": property_data["권리금"]
                 }
 
-        # ── 권리금 메모 (rich_text) ──
-        if "권리금 메모" in property_data:
-            properties["권리금 메모"] = {
-                "rich_text": [
-                    {"text": {"content": property_data["권리금 메모"]}}
-                ]
-            }
-
         # ── 🏢건축물용도 (multi_select) ──
         # property_data["건축물용도"]는 리스트 (예: ["제1종근린생활시설", "제2종근린생활시설"])
         if "건축물용도" in property_data:
@@ -1387,100 +1781,6 @@ class NotionUploader:
                 ]
             }
 
-        # ── 층별용도 (rich_text) - 복층/통상가 전용 ──
-        if "층별용도" in property_data:
-            properties["층별용도"] = {
-                "rich_text": [
-                    {
-                        "text": {
-                            "content": property_data["층별용도"][:2000]
-                        }
-                    }
-                ]
-            }
-
-        # ── 🏢 매물 유형 (select) ──
-        if "매물_유형" in property_data:
-            properties["🏢 매물 유형"] = {
-                "select": {"name": property_data["매물_유형"]}
-            }
-        
-        # ── 📍소재지(구) (select) ──
-        if "소재지_구" in property_data:
-            properties["📍소재지(구)"] = {
-                "select": {"name": property_data["소재지_구"]}
-            }
-        
-        # ── 임대 구분 (select) ──
-        if "임대_구분" in property_data:
-            properties["임대 구분"] = {
-                "select": {"name": property_data["임대_구분"]}
-            }
-
-        # ── 📐계약면적(m²) (number) ──
-        if "계약면적" in property_data:
-            properties["📐계약면적(m²)"] = {
-                "number": property_data["계약면적"]
-            }
-
-        # ── 📐전용면적(m²) (number) ──
-        if "전용면적" in property_data:
-            properties["📐전용면적(m²)"] = {
-                "number": property_data["전용면적"]
-            }
-
-        # ── 📐 층별면적상세 (rich_text) ──
-        if "층별면적상세" in property_data:
-            properties["📐 층별면적상세"] = {
-                "rich_text": [
-                    {"text": {"content": property_data["층별면적상세"]}}
-                ]
-            }
-
-        # ── 🅿️주차 (select) ──
-        if "주차" in property_data:
-            properties["🅿️주차"] = {
-                "select": {"name": property_data["주차"]}
-            }
-
-        # ── 주차 메모 (rich_text) ──
-        if "주차 메모" in property_data:
-            properties["주차 메모"] = {
-                "rich_text": [
-                    {"text": {"content": property_data["주차 메모"]}}
-                ]
-            }
-
-        # ── 📍방향 (select) ──
-        if "방향" in property_data:
-            properties["📍방향"] = {
-                "select": {"name": property_data["방향"]}
-            }
-
-        # ── 🚻화장실 위치 (select) ──
-        if "화장실 위치" in property_data:
-            properties["🚻화장실 위치"] = {
-                "select": {"name": property_data["화장실 위치"]}
-            }
-
-        # ── 🚻화장실 수 (select) ──
-        if "화장실 수" in property_data:
-            properties["🚻화장실 수"] = {
-                "select": {"name": property_data["화장실 수"]}
-            }
-
-        # ── 🚻화장실 형태 (select) ──
-        if "화장실 형태" in property_data:
-            properties["🚻화장실 형태"] = {
-                "select": {"name": property_data["화장실 형태"]}
-            }
-
-        # ── 🚨위반건축물 (select) ──
-        if "위반건축물" in property_data:
-            properties["🚨위반건축물"] = {
-                "select": {"name": property_data["위반건축물"]}
-            }
-
         # ── 상가 특징 (multi_select) ──
         if "상가_특징" in property_data:
             features = property_data["상가_특징"]
@@ -1501,77 +1801,8 @@ class NotionUploader:
 
         # ── 📅등록 날짜 (date) - 신규 등록 시에만 ──
         if not is_update:
-            now_dt = datetime.now()
             properties["📅등록 날짜"] = {
-                "date": {
-                    "start": now_dt.strftime("%Y-%m-%dT%H:%M:%S+09:00")
-                }
-            }
-
-        # ── 📢 특이사항 (rich_text) ──
-        if "특이사항" in property_data:
-            properties["📢 특이사항"] = {
-                "rich_text": [
-                    {
-                        "text": {
-                            "content": property_data["특이사항"][:2000]
-                        }
-                    }
-                ]
-            }
-
-        # ── 연락처 메모 (rich_text) ──
-        if "연락처 메모" in property_data:
-            properties["연락처 메모"] = {
-                "rich_text": [
-                    {
-                        "text": {
-                            "content": property_data["연락처 메모"]
-                        }
-                    }
-                ]
-            }
-
-        # ── 📞 대표 연락처 (phone_number) ──
-        if "대표 연락처" in property_data:
-            properties["📞 대표 연락처"] = {
-                "phone_number": property_data["대표 연락처"]
-            }
-
-        # ── 연락처 추가메모1 (rich_text) ──
-        if "연락처 추가메모1" in property_data:
-            properties["연락처 추가메모1"] = {
-                "rich_text": [
-                    {
-                        "text": {
-                            "content": property_data["연락처 추가메모1"]
-                        }
-                    }
-                ]
-            }
-
-        # ── 추가 연락처1 (phone_number) ──
-        if "추가 연락처1" in property_data:
-            properties["추가 연락처1"] = {
-                "phone_number": property_data["추가 연락처1"]
-            }
-
-        # ── 연락처 추가메모2 (rich_text) ──
-        if "연락처 추가메모2" in property_data:
-            properties["연락처 추가메모2"] = {
-                "rich_text": [
-                    {
-                        "text": {
-                            "content": property_data["연락처 추가메모2"]
-                        }
-                    }
-                ]
-            }
-
-        # ── 추가 연락처2 (phone_number) ──
-        if "추가 연락처2" in property_data:
-            properties["추가 연락처2"] = {
-                "phone_number": property_data["추가 연락처2"]
+                "date": {"start": _now_stamps()[0]}
             }
 
         # ── 거래 상태 (select) ──
@@ -1584,98 +1815,19 @@ class NotionUploader:
             properties["거래 상태"] = {
                 "select": {"name": "거래 가능"}
             }
-        
-        # ── 거래완료 시점 (rich_text) ──
-        if "거래완료_시점" in property_data:
-            properties["거래완료 시점"] = {
-                "rich_text": [
-                    {"text": {"content": property_data["거래완료_시점"]}}
-                ]
-            }
-
-        # ── 계약담당자 (select) ──
-        if "계약담당자" in property_data:
-            properties["계약담당자"] = {
-                "select": {"name": property_data["계약담당자"]}
-            }
-
-        # ── 텔레그램 동기화 정보 (number) ──
-        if "telegram_chat_id" in property_data:
-            properties["telegram_chat_id"] = {
-                "number": property_data["telegram_chat_id"]
-            }
-        if "telegram_msg_id" in property_data:
-            properties["telegram_msg_id"] = {
-                "number": property_data["telegram_msg_id"]
-            }
 
         return properties
 
     @staticmethod
     def _build_photo_blocks(photo_urls: List[str]) -> List[Dict]:
         """사진 URL 목록을 노션 블록 목록으로 변환 (2열 레이아웃)"""
-        blocks = []
-        for i in range(0, len(photo_urls), 2):
-            pair = photo_urls[i: i + 2]
-            if len(pair) == 2:
-                blocks.append(
-                    {
-                        "object": "block",
-                        "type": "column_list",
-                        "column_list": {
-                            "children": [
-                                {
-                                    "object": "block",
-                                    "type": "column",
-                                    "column": {
-                                        "children": [
-                                            {
-                                                "object": "block",
-                                                "type": "image",
-                                                "image": {
-                                                    "type": "external",
-                                                    "external": {
-                                                        "url": pair[0]
-                                                    },
-                                                },
-                                            }
-                                        ]
-                                    },
-                                },
-                                {
-                                    "object": "block",
-                                    "type": "column",
-                                    "column": {
-                                        "children": [
-                                            {
-                                                "object": "block",
-                                                "type": "image",
-                                                "image": {
-                                                    "type": "external",
-                                                    "external": {
-                                                        "url": pair[1]
-                                                    },
-                                                },
-                                            }
-                                        ]
-                                    },
-                                },
-                            ]
-                        },
-                    }
-                )
-            else:
-                # 홀수 마지막 1장은 전체 너비
-                blocks.append(
-                    {
-                        "object": "block",
-                        "type": "image",
-                        "image": {
-                            "type": "external",
-                            "external": {"url": pair[0]},
-                        },
-                    }
-                )
+        blocks = [
+            _column_pair(u1, u2)
+            for u1, u2 in zip(photo_urls[::2], photo_urls[1::2])
+        ]
+        if len(photo_urls) % 2:
+            # 홀수 마지막 1장은 전체 너비
+            blocks.append(_image_block(photo_urls[-1]))
         return blocks
 
     def upload_property(
@@ -1745,7 +1897,12 @@ class NotionUploader:
             )
 
         # ── 특이사항 블록 (사진 아래에 표시) ──
-        if "특이사항" in property_data and property_data["특이사항"].strip():
+        # 빈 줄을 제외한 문단 목록을 한 번만 만들어 존재 여부 판단에도 사용
+        note_paragraphs = [
+            p for p in property_data.get("특이사항", "").split("\n")
+            if p.strip()
+        ]
+        if note_paragraphs:
             children.append(
                 {
                     "object": "block",
@@ -1764,26 +1921,20 @@ class NotionUploader:
                     },
                 }
             )
-            for paragraph in property_data["특이사항"].split("\n"):
-                if paragraph.strip():
-                    children.append(
-                        {
-                            "object": "block",
-                            "type": "paragraph",
-                            "paragraph": {
-                                "rich_text": [
-                                    {
-                                        "text": {
-                                            "content": paragraph
-                                        }
-                                    }
-                                ]
-                            },
-                        }
-                    )
+            children.extend(
+                {
+                    "object": "block",
+                    "type": "paragraph",
+                    "paragraph": {
+                        "rich_text": [{"text": {"content": paragraph}}]
+                    },
+                }
+                for paragraph in note_paragraphs
+            )
 
-        # 원본 메시지
-        if "원본 메시지" in property_data:
+        # 원본 메시지 (공백뿐이면 구분선/헤딩까지 생략)
+        original = property_data.get("원본 메시지", "")
+        if original.strip():
             children.append(
                 {
                     "object": "block",
@@ -1808,13 +1959,7 @@ class NotionUploader:
                     "type": "paragraph",
                     "paragraph": {
                         "rich_text": [
-                            {
-                                "text": {
-                                    "content": property_data[
-                                        "원본 메시지"
-                                    ][:2000]
-                                }
-                            }
+                            {"text": {"content": original[:2000]}}
                         ]
                     },
                 }
@@ -1824,9 +1969,8 @@ class NotionUploader:
         try:
             # Notion API: pages.create 시 children 최대 100개 제한
             # 100개 초과 블록은 페이지 생성 후 append로 나눠서 추가
-            NOTION_CREATE_LIMIT = 100
-            first_chunk = children[:NOTION_CREATE_LIMIT]
-            overflow_blocks = children[NOTION_CREATE_LIMIT:]
+            first_chunk = children[:self.NOTION_BLOCK_LIMIT]
+            overflow_blocks = children[self.NOTION_BLOCK_LIMIT:]
 
             create_kwargs = {
                 "parent": {"database_id": self.database_id},
@@ -1841,34 +1985,38 @@ class NotionUploader:
                 **create_kwargs,
             )
             page_id = response["id"]
+            if property_data.get("telegram_msg_id"):
+                self._index_msg(int(property_data["telegram_msg_id"]), page_id)
 
             # 100개 초과 블록은 청크 단위로 추가 append
             if overflow_blocks:
-                chunk_size = 100
-                for i in range(0, len(overflow_blocks), chunk_size):
-                    chunk = overflow_blocks[i: i + chunk_size]
-                    try:
-                        self._notion_api_call_with_retry(
-                            self.client.blocks.children.append,
-                            label="blocks.append",
-                            block_id=page_id,
-                            children=chunk,
-                        )
-                    except Exception as e:
-                        logger.warning(
-                            f"사진 블록 추가 append 실패 (일부 누락 가능): {e}"
-                        )
+                try:
+                    self._append_in_chunks(page_id, overflow_blocks)
+                except Exception as e:
+                    logger.warning(
+                        f"사진 블록 추가 append 실패 (일부 누락 가능): {e}"
+                    )
 
             # ID만으로 URL 생성 (제목 포함 방지 → 검색 깔끔)
-            clean_url = (
-                f"https://www.notion.so/"
-                f"{page_id.replace('-', '')}"
-            )
-            return clean_url, page_id
+            return _page_url(page_id), page_id
         except Exception as e:
             logger.error(f"노션 업로드 실패: {e}")
             raise Exception(f"노션 업로드 실패: {str(e)}")
 
+    async def create_page(
+        self,
+        property_data: Dict,
+        photo_urls: Optional[List[str]] = None,
+        floor_photos: Optional[List[Dict]] = None,
+    ) -> Tuple[str, str]:
+        """upload_property를 스레드에서 실행 (동시 생성 수 제한)"""
+        async with self._create_sem:
+            return await asyncio.to_thread(
+                self.upload_property,
+                property_data, photo_urls,
+                floor_photos=floor_photos,
+            )
+
     def update_property(
         self, page_id: str, property_data: Dict
     ) -> str:
@@ -1893,10 +2041,7 @@ class NotionUploader:
                 page_id=page_id,
                 properties=properties,
             )
-            return (
-                f"https://www.notion.so/"
-                f"{page_id.replace('-', '')}"
-            )
+            return _page_url(page_id)
         except Exception as e:
             logger.error(f"노션 업데이트 실패: {e}")
             raise Exception(f"노션 업데이트 실패: {str(e)}")
@@ -1915,6 +2060,10 @@ class NotionUploader:
             self.client.pages.update(
                 page_id=page_id, archived=True
             )
+            clean_id = _clean_pid(page_id)
+            if self._tracked_snapshot.pop(clean_id, None) is not None:
+                self._save_tracked_snapshot()
+            self._unindex_page(page_id)
             logger.info(f"노션 페이지 아카이브 완료: {page_id}")
             return True
         except Exception as e:
@@ -1934,14 +2083,13 @@ class NotionUploader:
             성공 여부
         """
         try:
-            now = datetime.now()
             properties = {
                 "거래 상태": {
                     "select": {"name": "거래 완료"}
                 },
                 "거래완료 시점": {
                     "rich_text": [
-                        {"text": {"content": now.strftime("%Y-%m-%d %H:%M")}}
+                        {"text": {"content": _now_stamps()[1]}}
                     ]
                 },
             }
@@ -1960,26 +2108,34 @@ class NotionUploader:
             return True
         except Exception as e:
             logger.error(f"거래완료 업데이트 실패: {e}")
+            self._unindex_if_archived(page_id, e)
             return False
 
+    def _append_in_chunks(
+        self, page_id: str, blocks: List[Dict], chunk: int = NOTION_BLOCK_LIMIT
+    ) -> None:
+        """블록을 chunk개씩 나눠 페이지 하단에 추가 (실패 시 예외 전파)
+
+        Notion API는 요청당 children 최대 100개만 허용.
+        """
+        for i in range(0, len(blocks), chunk):
+            self._notion_api_call_with_retry(
+                self.client.blocks.children.append,
+                label="blocks.append",
+                block_id=page_id,
+                children=blocks[i: i + chunk],
+            )
+
     def append_blocks_to_page(
         self, page_id: str, blocks: List[Dict]
     ) -> bool:
-        """기존 노션 페이지 하단에 블록 추가 (추가사진 등)
-        
-        Notion API는 한 번에 최대 100개 블록만 허용하므로 청킹 처리.
-        """
+        """기존 노션 페이지 하단에 블록 추가 (추가사진 등)"""
         try:
-            chunk_size = 100
-            for i in range(0, len(blocks), chunk_size):
-                chunk = blocks[i: i + chunk_size]
-                self.client.blocks.children.append(
-                    block_id=page_id,
-                    children=chunk,
-                )
+            self._append_in_chunks(page_id, blocks)
             return True
         except Exception as e:
             logger.error(f"노션 블록 추가 실패: {e}")
+            self._unindex_if_archived(page_id, e)
             return False
 
     def update_page_raw_properties(
@@ -1996,6 +2152,7 @@ class NotionUploader:
             return True
         except Exception as e:
             logger.warning(f"페이지 속성 업데이트 실패: {e}")
+            self._unindex_if_archived(page_id, e)
             return False
 
     def _get_next_property_number_UNUSED(self) -> str:
@@ -2304,8 +2461,54 @@ class NotionUploader:
             )
             return False
 
+    def build_msg_index(self) -> int:
+        """추적 페이지 전체를 한 번에 조회해 msg_id 역인덱스 구성
+
+        Returns:
+            인덱스에 등록된 페이지 수
+        """
+        for p in self.iter_tracked_pages():
+            self._index_msg(p["msg_id"], p["page_id"])
+        return len(self._msg_index)
+
+    def _index_msg(self, msg_id: int, page_id: str):
+        """msg_id → page_id 역인덱스 등록 (양방향 맵을 잠금 안에서 함께 갱신)"""
+        clean_id = _clean_pid(page_id)
+        with self._msg_index_lock:
+            old_page_id = self._msg_index.get(msg_id)
+            if old_page_id is not None:
+                old_ids = self._page_msg_ids.get(_clean_pid(old_page_id))
+                if old_ids is not None:
+                    old_ids.discard(msg_id)
+            self._msg_index[msg_id] = page_id
+            self._page_msg_ids.setdefault(clean_id, set()).add(msg_id)
+
+    def _unindex_page(self, page_id: str):
+        """page_id에 연결된 msg_id들을 역인덱스에서 제거"""
+        with self._msg_index_lock:
+            for msg_id in self._page_msg_ids.pop(_clean_pid(page_id), ()):
+                self._msg_index.pop(msg_id, None)
+
+    def _unindex_if_archived(self, page_id: str, error: Exception):
+        """노션이 아카이브된 페이지라고 응답하면 역인덱스에서 제거
+
+        노션 UI에서 직접 삭제한 페이지도 다음 find_page_by_msg_id 호출에서
+        DB 쿼리(아카이브 페이지 제외)로 다시 조회되도록 함.
+        """
+        if isinstance(error, APIResponseError) and "archived" in str(error):
+            self._unindex_page(page_id)
+            logger.info(f"아카이브된 페이지 인덱스 제거: {page_id}")
+
     def find_page_by_msg_id(self, msg_id: int) -> Optional[str]:
-        """telegram_msg_id로 노션 페이지 ID 조회 (봇 재시작 후 복구용)"""
+        """telegram_msg_id로 노션 페이지 ID 조회 (봇 재시작 후 복구용)
+
+        역인덱스에 없을 때만 노션 DB 쿼리 (찾으면 인덱스에 추가).
+        노션 호출이 아카이브를 보고한 페이지는 _unindex_if_archived로
+        인덱스에서 빠지므로 그 뒤에는 다시 DB 쿼리로 조회됨.
+        """
+        page_id = self._msg_index.get(msg_id)
+        if page_id:
+            return page_id
         try:
             response = self.client.databases.query(
                 database_id=self.database_id,
@@ -2317,6 +2520,7 @@ class NotionUploader:
             )
             for page in response.get("results", []):
                 if not page.get("archived", False):
+                    self._index_msg(msg_id, page["id"])
                     return page["id"]
             return None
         except Exception as e:
@@ -2344,7 +2548,7 @@ class NotionUploader:
         return addr
 
     def find_pages_by_address(
-        self, address: str, exclude_page_id: str = None
+        self, address: str, exclude_page_id: str = None, limit: int = 5
     ) -> List[Dict]:
         """주소로 노션 페이지 검색 (동일 주소 중복 감지용)
 
@@ -2353,84 +2557,103 @@ class NotionUploader:
         Args:
             address: 검색할 주소 문자열
             exclude_page_id: 결과에서 제외할 페이지 ID (새로 만든 페이지)
+            limit: 이 개수만큼 찾으면 남은 페이지 조회 없이 바로 반환
 
         Returns:
             [{"page_id": str, "title": str, "url": str}, ...]
         """
         try:
-            # 층수까지만 추출하여 비교 키로 사용
-            location_key = self._extract_location_key(address)
-            # 너무 짧으면 오탐 방지
-            if len(location_key) < 5:
-                return []
-            # 노션 검색은 location_key로 (contains 필터)
-            clean_addr = location_key
-
-            results = []
-            has_more = True
-            start_cursor = None
+            return list(islice(
+                self.iter_pages_by_address(address, exclude_page_id), limit
+            ))
+        except Exception as e:
+            logger.error(f"주소 검색 실패: {e}")
+            return []
 
-            while has_more:
-                query_params: Dict = {
-                    "database_id": self.database_id,
-                    "filter": {
-                        "property": "주소 및 상호",
-                        "title": {"contains": clean_addr},
-                    },
-                    "page_size": 100,
-                }
-                if start_cursor:
-                    query_params["start_cursor"] = start_cursor
+    def iter_pages_by_address(
+        self, address: str, exclude_page_id: str = None
+    ) -> Iterator[Dict]:
+        """find_pages_by_address의 제너레이터 버전 (필요한 만큼만 페이지 조회)
 
-                response = self.client.databases.query(**query_params)
+        API 오류는 호출 측으로 전파.
+        """
+        # 층수까지만 추출하여 비교 키로 사용
+        location_key = self._extract_location_key(address)
+        # 너무 짧으면 오탐 방지
+        if len(location_key) < 5:
+            return
+        exclude_clean = (
+            _clean_pid(exclude_page_id) if exclude_page_id else None
+        )
+        # 응답은 제목 속성만 받음 (페이로드 축소)
+        prop_ids = self._filter_properties_for(("주소 및 상호",))
 
-                for page in response.get("results", []):
-                    if page.get("archived", False):
-                        continue
-                    pid = page["id"]
-                    # 방금 생성한 페이지 제외
-                    if exclude_page_id and (
-                        pid.replace("-", "")
-                        == exclude_page_id.replace("-", "")
-                    ):
-                        continue
+        has_more = True
+        start_cursor = None
 
-                    props = page.get("properties", {})
-                    title_list = props.get(
-                        "주소 및 상호", {}
-                    ).get("title", [])
-                    title = (
-                        title_list[0]
-                        .get("text", {})
-                        .get("content", "")
-                        if title_list
-                        else ""
-                    )
+        while has_more:
+            query_params: Dict = {
+                "database_id": self.database_id,
+                # 노션 검색은 location_key로 (contains 필터)
+                "filter": {
+                    "property": "주소 및 상호",
+                    "title": {"contains": location_key},
+                },
+                "page_size": 100,
+            }
+            if start_cursor:
+                query_params["start_cursor"] = start_cursor
+            if prop_ids:
+                query_params["filter_properties"] = prop_ids
 
-                    # 노션에 저장된 주소도 층수까지만 추출해서 비교
-                    # → 상호가 달라도 번지+층수 같으면 중복 감지
-                    stored_key = self._extract_location_key(title)
-                    if location_key not in stored_key and stored_key not in location_key:
-                        continue
+            try:
+                response = self.client.databases.query(**query_params)
+            except Exception as e:
+                if not prop_ids:
+                    raise
+                logger.warning(
+                    f"filter_properties 조회 실패 → 전체 조회로 재시도: {e}"
+                )
+                self._filter_prop_ids = {}
+                prop_ids = None
+                continue
+            # 필터 검증은 첫 페이지에서만 (아직 아무것도 yield 전)
+            if start_cursor is None and self._check_filtered_response(
+                response, prop_ids, "주소 및 상호"
+            ):
+                prop_ids = None
+                continue
 
-                    results.append(
-                        {
-                            "page_id": pid,
-                            "title": title,
-                            "url": (
-                                "https://www.notion.so/"
-                                f"{pid.replace('-', '')}"
-                            ),
-                        }
-                    )
+            for page in response.get("results", []):
+                if page.get("archived", False):
+                    continue
+                pid = page["id"]
+                pid_clean = _clean_pid(pid)
+                # 방금 생성한 페이지 제외
+                if pid_clean == exclude_clean:
+                    continue
 
-                has_more = response.get("has_more", False)
-                start_cursor = response.get("next_cursor")
+                try:
+                    title = page["properties"]["주소 및 상호"][
+                        "title"
+                    ][0]["text"]["content"]
+                except (KeyError, IndexError, TypeError):
+                    title = ""
+
+                # 노션에 저장된 주소도 층수까지만 추출해서 비교
+                # → 상호가 달라도 번지+층수 같으면 중복 감지
+                stored_key = self._extract_location_key(title)
+                if location_key not in stored_key and stored_key not in location_key:
+                    continue
 
-            return results
-        except Exception as e:
-            logger.error(f"주소 검색 실패: {e}")
-            return []
+                yield {
+                    "page_id": pid,
+                    "title": title,
+                    "url": f"https://www.notion.so/{pid_clean}",
+                }
+
+            has_more = response.get("has_more", False)
+            start_cursor = response.get("next_cursor")
 
     def get_page_address(self, page_id: str) -> Optional[str]:
         """노션 페이지의 '주소 및 상호' title 속성을 반환"""
@@ -2448,105 +2671,15 @@ class NotionUploader:
         """노션 페이지의 현재 속성값을 파싱하여 반환"""
         try:
             page = self.client.pages.retrieve(page_id=page_id)
-            props = page.get("properties", {})
             result = {}
-
-            # 주소 (title)
-            if "주소 및 상호" in props:
-                title_arr = props["주소 및 상호"].get(
-                    "title", []
-                )
-                if title_arr:
-                    result["주소"] = (
-                        title_arr[0]
-                        .get("text", {})
-                        .get("content", "")
-                    )
-
-            # 층수 (multi_select)
-            if "층수" in props:
-                ms = props["층수"].get("multi_select", [])
-                if ms:
-                    result["층수"] = ms[0].get("name", "")
-
-            # 숫자 속성
-            for key, notion_key in [
-                ("보증금", "💰보증금"),
-                ("월세", "💰월세"),
-                ("권리금", "💎권리금"),
-                ("계약면적", "📐계약면적(m²)"),
-                ("전용면적", "📐전용면적(m²)"),
-            ]:
-                if notion_key in props:
-                    val = props[notion_key].get("number")
-                    if val is not None:
-                        # float → int 변환 (2000.0 → 2000)
-                        result[key] = (
-                            int(val) if val == int(val) else val
-                        )
-
-            # 선택 속성
-            for key, notion_key in [
-                ("부가세", "🧾부가세 여부"),
-                ("주차", "🅿️주차"),
-                ("방향", "📍방향"),
-                ("화장실 위치", "🚻화장실 위치"),
-                ("화장실 수", "🚻화장실 수"),
-                ("위반건축물", "🚨위반건축물"),
-                ("매물_유형", "🏢 매물 유형"),
-                ("소재지_구", "📍소재지(구)"),
-                ("임대_구분", "임대 구분"),
-                ("거래_상태", "거래 상태"),
-            ]:
-                if notion_key in props:
-                    sel = props[notion_key].get("select")
-                    if sel:
-                        result[key] = sel.get("name", "")
-
-            # 건축물용도 (multi_select) - 리스트로 반환
-            if "🏢건축물용도" in props:
-                ms = props["🏢건축물용도"].get("multi_select", [])
-                if ms:
-                    result["건축물용도"] = [
-                        item.get("name", "")
-                        for item in ms
-                        if item.get("name")
-                    ]
-
-            # 텍스트 속성
-            for key, notion_key in [
-                ("관리비", "⚡관리비(텍스트)"),
-                ("특이사항", "📢 특이사항"),
-            ]:
-                if notion_key in props:
-                    rt = props[notion_key].get(
-                        "rich_text", []
-                    )
-                    if rt:
-                        result[key] = (
-                            rt[0]
-                            .get("text", {})
-                            .get("content", "")
-                        )
-
-            # 상가 특징 (multi_select) - 리스트로 반환
-            if "상가 특징" in props:
-                ms = props["상가 특징"].get("multi_select", [])
-                if ms:
-                    result["상가_특징"] = [
-                        item.get("name", "")
-                        for item in ms
-                        if item.get("name")
-                    ]
-
-            # 전화번호 속성
-            if "📞 대표 연락처" in props:
-                val = props["📞 대표 연락처"].get(
-                    "phone_number"
-                )
-                if val:
-                    result["대표 연락처"] = val
-
+            for notion_key, prop in page.get("properties", {}).items():
+                spec = self._PROP_EXTRACTORS.get(notion_key)
+                if spec is None:
+                    continue
+                key, extract = spec
+                value = extract(prop)
+                if value is not None:
+                    result[key] = value
             return result
         except Exception as e:
             logger.warning(f"페이지 속성 조회 실패: {e}")
@@ -2559,72 +2692,136 @@ class NotionUploader:
             [{"page_id": str, "chat_id": int, "msg_id": int,
               "title": str}, ...]
         """
-        results = []
+        return list(self.iter_tracked_pages())
+
+    def get_tracked_pages_snapshot(self) -> List[Dict]:
+        """추적 페이지 목록 (메모리 스냅샷 + 마지막 조회 이후 변경분만 조회)
+
+        TRACKED_FULL_REFRESH마다 전체 재조회로 스냅샷을 새로 만들고,
+        그 사이에는 last_edited_time 기준 변경분만 받아 병합.
+        스냅샷은 파일에도 저장되어 봇 재시작 직후에도 증분 조회로 시작.
+        조회 실패 시 기준 시각을 유지한 채 기존 스냅샷 반환 (다음 호출에서 재조회).
+        """
+        if not self._snapshot_loaded:
+            self._snapshot_loaded = True
+            self._load_tracked_snapshot()
+        started = time.time()
+        full = (
+            self._tracked_cursor is None
+            or started - self._tracked_full_at > self.TRACKED_FULL_REFRESH
+        )
+        try:
+            fetched = list(self.iter_tracked_pages(
+                since=None if full else self._tracked_cursor,
+                raise_errors=True,
+            ))
+        except Exception as e:
+            logger.error(f"추적 페이지 조회 실패 (기존 스냅샷 사용): {e}")
+            return list(self._tracked_snapshot.values())
+
+        if full:
+            self._tracked_snapshot = {}
+            self._tracked_full_at = started
+        for page_info in fetched:
+            self._tracked_snapshot[_clean_pid(page_info["page_id"])] = page_info
+        # last_edited_time은 분 단위로 잘리므로 2분 겹치게 기준 시각 설정
+        self._tracked_cursor = time.strftime(
+            "%Y-%m-%dT%H:%M:%SZ", time.gmtime(started - 120)
+        )
+        self._save_tracked_snapshot()
+        logger.info(
+            f"추적 페이지 {'전체' if full else '증분'} 조회: "
+            f"{len(fetched)}개 수신, 스냅샷 {len(self._tracked_snapshot)}개"
+        )
+        return list(self._tracked_snapshot.values())
+
+    def iter_tracked_pages(
+        self, since: Optional[str] = None, raise_errors: bool = False,
+    ) -> Iterator[Dict]:
+        """get_tracked_pages의 제너레이터 버전 (페이지 단위로 조회하며 yield)
+
+        Args:
+            since: ISO 시각 - 지정 시 이 시각 이후 수정된 페이지만 조회
+            raise_errors: True면 조회 실패 시 예외 전파 (기본은 로그 후 중단)
+        """
+        msg_filter = {
+            "property": "telegram_msg_id",
+            "number": {"is_not_empty": True},
+        }
+        if since:
+            query_filter = {"and": [
+                msg_filter,
+                {
+                    "timestamp": "last_edited_time",
+                    "last_edited_time": {"on_or_after": since},
+                },
+            ]}
+        else:
+            query_filter = msg_filter
         has_more = True
         start_cursor = None
+        # 응답은 읽는 속성 3개만 받음 (페이로드 축소)
+        prop_ids = self._filter_properties_for(
+            ("telegram_chat_id", "telegram_msg_id", "주소 및 상호")
+        )
 
         while has_more:
             query_params = {
                 "database_id": self.database_id,
                 "page_size": 100,
-                "filter": {
-                    "property": "telegram_msg_id",
-                    "number": {"is_not_empty": True},
-                },
+                "filter": query_filter,
             }
             if start_cursor:
                 query_params["start_cursor"] = start_cursor
+            if prop_ids:
+                query_params["filter_properties"] = prop_ids
 
             try:
                 response = self.client.databases.query(
                     **query_params
                 )
             except Exception as e:
+                if prop_ids:
+                    logger.warning(
+                        f"filter_properties 조회 실패 → 전체 조회로 재시도: {e}"
+                    )
+                    self._filter_prop_ids = {}
+                    prop_ids = None
+                    continue
+                if raise_errors:
+                    raise
                 logger.error(f"추적 페이지 조회 실패: {e}")
                 break
+            # 필터 검증은 첫 페이지에서만 (아직 아무것도 yield 전)
+            if start_cursor is None and self._check_filtered_response(
+                response, prop_ids, "telegram_msg_id"
+            ):
+                prop_ids = None
+                continue
 
             for page in response.get("results", []):
                 if page.get("archived"):
                     continue
                 props = page.get("properties", {})
 
-                chat_id = None
-                msg_id = None
-                title = ""
-
-                if "telegram_chat_id" in props:
-                    chat_id = props["telegram_chat_id"].get(
-                        "number"
-                    )
-                if "telegram_msg_id" in props:
-                    msg_id = props["telegram_msg_id"].get(
-                        "number"
-                    )
-
-                title_prop = props.get("주소 및 상호", {})
-                title_list = title_prop.get("title", [])
-                if title_list:
-                    title = (
-                        title_list[0]
-                        .get("text", {})
-                        .get("content", "")
-                    )
+                try:
+                    chat_id = props["telegram_chat_id"]["number"]
+                    msg_id = props["telegram_msg_id"]["number"]
+                except KeyError:
+                    continue
+                title = _prop_title(props.get("주소 및 상호", {})) or ""
 
                 if chat_id and msg_id:
-                    results.append(
-                        {
-                            "page_id": page["id"],
-                            "chat_id": int(chat_id),
-                            "msg_id": int(msg_id),
-                            "title": title,
-                        }
-                    )
+                    yield {
+                        "page_id": page["id"],
+                        "chat_id": int(chat_id),
+                        "msg_id": int(msg_id),
+                        "title": title,
+                    }
 
             has_more = response.get("has_more", False)
             start_cursor = response.get("next_cursor")
 
-        return results
-
 
 class DualNotionUploader:
     """공유 DB + 개인 DB 이중 기록 래퍼.
@@ -2647,6 +2844,8 @@ class DualNotionUploader:
         self.primary = primary
         self.secondary = secondary
         self._pair_map: Dict[str, str] = {}
+        # 워커 스레드(to_thread)에서 동시에 파일 저장할 때 직렬화
+        self._pair_lock = threading.Lock()
         if self.secondary:
             self._load_pair_map()
 
@@ -2674,9 +2873,11 @@ class DualNotionUploader:
 
     def _save_pair_map(self):
         try:
-            with open(self._PAIR_MAP_FILE, "w", encoding="utf-8") as f:
+            with self._pair_lock, open(
+                self._PAIR_MAP_FILE, "w", encoding="utf-8"
+            ) as f:
                 _json.dump(
-                    self._pair_map, f, ensure_ascii=False, indent=2,
+                    dict(self._pair_map), f, ensure_ascii=False, indent=2,
                 )
         except Exception as e:
             logger.warning(f"페어 매핑 저장 실패: {e}")
@@ -2692,8 +2893,9 @@ class DualNotionUploader:
         """
         if not self.secondary:
             return None
-        if primary_page_id in self._pair_map:
-            return self._pair_map[primary_page_id]
+        cached = self._pair_map.get(primary_page_id)
+        if cached is not None:
+            return cached
         try:
             props = self.primary.get_page_properties(primary_page_id)
             msg_id_raw = props.get("telegram_msg_id")
@@ -2753,6 +2955,32 @@ class DualNotionUploader:
                 )
         return page_url, page_id
 
+    async def create_page(
+        self,
+        property_data: Dict,
+        photo_urls: Optional[List[str]] = None,
+        floor_photos: Optional[List[Dict]] = None,
+    ) -> Tuple[str, str]:
+        page_url, page_id = await self.primary.create_page(
+            property_data, photo_urls, floor_photos=floor_photos,
+        )
+        if self.secondary:
+            try:
+                _, sid = await self.secondary.create_page(
+                    property_data, photo_urls,
+                    floor_photos=floor_photos,
+                )
+                self._pair_map[page_id] = sid
+                await asyncio.to_thread(self._save_pair_map)
+                logger.info(
+                    f"개인 DB 저장 완료: {sid[:8]}…"
+                )
+            except Exception as e:
+                logger.warning(
+                    f"개인 DB 저장 실패 (공유 DB만 반영됨): {e}"
+                )
+        return page_url, page_id
+
     def update_property(
         self, page_id: str, property_data: Dict
     ) -> str:
@@ -2841,6 +3069,193 @@ class DualNotionUploader:
         return getattr(primary, name)
 
 
+# ── 메시지마다 쓰이는 정규식 (모듈 로드 시 1회 컴파일) ──
+_PAGE_ID_RE = re.compile(r'([a-f0-9]{32})')
+_NOTION_URL_ID_RE = re.compile(r'notion\.so/[^\s]*?([a-f0-9]{32})')
+_DEAL_RE = re.compile(r'[\(\[]\s*(?:계약|거래)\s*완료\s*([^\)\]]*)\s*[\)\]]')
+_WS_RE = re.compile(r'\s+')
+_NUM_PREFIX_RE = re.compile(r'[1-8]\.')
+# 공백·줄바꿈이 끼어 있어도 "거래완료"/"계약완료" 감지
+_DEAL_FOUND_RE = re.compile(r'(?:거[ \n]*래|계[ \n]*약)[ \n]*완[ \n]*료')
+# 층수 라벨 ("1층", "B1층", "지하층", "1,2층" 등)
+_FLOOR_RE = re.compile(r'([B지하]?\d*(?:[,~\-]\d+)*층)')
+# 주소의 지하층 표기 ("지하1층", "지하 2 층")
+_BASEMENT_RE = re.compile(r'(지하\s*\d+\s*층)')
+# 9번 항목(상가 특징) 존재 여부
+_SECTION9_RE = re.compile(r'(?:^|\n)\s*9\.')
+# 연락처(전화번호) 패턴
+_CONTACT_RE = re.compile(r'\d{2,3}[-\s]?\d{3,4}[-\s]?\d{4}')
+# 추가사진 캡션에서 '추가'/'사진' 글자 제거용 변환표 (str.translate)
+_EXTRA_STRIP = str.maketrans("", "", "추가사진")
+# 구분선 아래 수정 이력 줄 ("🔄 ..."), 줄 앞 공백 무시
+_LOG_LINE_RE = re.compile(r'^[^\S\n]*(🔄[^\n]*)', re.MULTILINE)
+
+
+# 메시지 존재 확인(edit_message_reply_markup) BadRequest 메시지 → 존재 여부
+# (python-telegram-bot이 "Bad Request: " 접두어 제거 후 첫 글자만 대문자로 바꾼 형태)
+_PROBE_BADREQUEST_RESULTS = {
+    "Message to edit not found": False,
+    "Message_id_invalid": False,
+    "Message can't be edited": True,
+    "Message is not modified": True,
+    "There is no reply_markup in the message to edit": True,
+}
+
+
+def _hyphenate(raw_id: str) -> str:
+    """32자리 hex page_id → 하이픈 포함 UUID 형식 (8-4-4-4-12)"""
+    return str(uuid.UUID(raw_id))
+
+
+class _LRUDict(OrderedDict):
+    """최대 크기가 정해진 dict (가장 오래 사용되지 않은 항목부터 제거)
+
+    저장 시(또는 touch 호출 시) 항목을 최신으로 옮기고, maxsize 초과 시 가장
+    오래된 항목 삭제. 단순 조회는 순서를 바꾸지 않으므로 순회 중 조회해도 안전.
+    밀려난 매핑은 메시지의 Notion 링크 / Notion DB 검색으로 다시 복구됨.
+    """
+
+    def __init__(self, maxsize: int, *args, **kwargs):
+        self.maxsize = maxsize
+        super().__init__(*args, **kwargs)
+        while len(self) > maxsize:
+            self.popitem(last=False)
+
+    def __reduce__(self):
+        # copy.copy / pickle 이 maxsize 를 함께 넘기도록
+        return (self.__class__, (self.maxsize, list(self.items())))
+
+    def copy(self):
+        return self.__class__(self.maxsize, self.items())
+
+    def touch(self, key) -> None:
+        """항목을 최신 사용으로 표시 (없으면 무시)"""
+        if key in self:
+            self.move_to_end(key)
+
+    def __setitem__(self, key, value):
+        if key in self:
+            self.move_to_end(key)
+        super().__setitem__(key, value)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+class _TokenBucket:
+    """비동기 토큰 버킷 속도 제한기 (초당 rate회, 최대 capacity회 연속 허용)
+
+    사용: ``async with bucket: await api_call()``
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class _Track:
+    """메시지별 추적 정보 (노션 page_id · 채팅 ID · 원본 매물 텍스트)"""
+
+    __slots__ = ("page_id", "chat_id", "text")
+
+    def __init__(
+        self, page_id: str, chat_id: Optional[int] = None,
+        text: Optional[str] = None,
+    ):
+        self.page_id = page_id
+        self.chat_id = chat_id
+        self.text = text
+
+
+def _new_floor_groups() -> List[Dict]:
+    return [{"label": None, "photos": []}]
+
+
+class _ChatBuffer:
+    """채팅별 사진 수집 버퍼 (복수 미디어그룹 + 분리 텍스트 묶음 처리)"""
+
+    __slots__ = ("floor_groups", "first_message", "author_signature")
+
+    def __init__(
+        self, floor_groups: Optional[List[Dict]] = None,
+        first_message: Any = None, author_signature: Optional[str] = None,
+    ):
+        # 층별 사진 그룹: [{"label": "1층"|None, "photos": [...]}]
+        self.floor_groups = (
+            floor_groups if floor_groups is not None else _new_floor_groups()
+        )
+        self.first_message = first_message
+        self.author_signature = author_signature
+
+
+class _MediaGroup:
+    """앨범(미디어 그룹) 사진 수집 버퍼"""
+
+    __slots__ = (
+        "message", "context", "photos", "caption",
+        "author_signature", "reply_to_message",
+    )
+
+    def __init__(
+        self, message: Any, context: Any = None,
+        caption: Optional[str] = None,
+        author_signature: Optional[str] = None,
+        reply_to_message: Any = None,
+    ):
+        self.message = message
+        self.context = context  # 30초 저장 버퍼에서 사용
+        self.photos: List[str] = []
+        self.caption = caption
+        self.author_signature = author_signature
+        self.reply_to_message = reply_to_message  # 답장 대상 메시지
+
+
+class _ExtraPhotoBuf:
+    """추가사진 저장 대기 버퍼 (원본 매물 메시지별)"""
+
+    __slots__ = ("page_id", "label", "chat_id", "cld_folder", "photos", "timer")
+
+    def __init__(
+        self, page_id: str, label: str = "추가사진",
+        chat_id: Optional[int] = None, cld_folder: str = "real_estate",
+    ):
+        self.page_id = page_id
+        self.label = label
+        self.chat_id = chat_id  # 두 번째 앨범 연결용
+        self.cld_folder = cld_folder
+        self.photos: List[str] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+@lru_cache(maxsize=256)
+def _escape_cached(text: str) -> str:
+    """html.escape 결과 캐시 (같은 매물 텍스트를 여러 번 재수정할 때 재사용)"""
+    return html.escape(text)
+
+
 class TelegramNotionBot:
     """텔레그램-노션 연동 봇 (앨범/여러 장 사진 + 원본 수정 자동 반영)"""
 
@@ -2851,6 +3266,32 @@ class TelegramNotionBot:
     PROPERTY_COLLECT_WINDOW = 30 * 24 * 60 * 60
     # 저장 대기 버퍼 (초) - 매물 설명 감지 후 이 시간 후에 저장 (실수 삭제 방지)
     PROPERTY_SAVE_BUFFER = 30
+    # getFile 결과(file_path) 캐시 개수 / 유효 시간 (Bot API 보장 1시간보다 짧게)
+    FILE_PATH_CACHE_SIZE = 4096
+    FILE_PATH_TTL = 50 * 60
+    # 동기화 시 메시지 존재 확인 동시 요청 수
+    SYNC_PROBE_CONCURRENCY = 8
+    # 봇 전체 Bot API 초당 최대 요청 수 (텔레그램 한도 30회/초에 여유 두기)
+    TELEGRAM_API_RATE = 25
+    # 동기화 시 노션 아카이브 동시 요청 수 (Notion API 평균 ~3 req/s)
+    SYNC_ARCHIVE_CONCURRENCY = 3
+    # 동일 주소 중복 알림에 사용할 최대 검색 건수
+    DUPLICATE_SEARCH_LIMIT = 5
+    # Bot API 연결 풀 대기 / 연결 수립 제한 시간 (초)
+    HTTP_POOL_TIMEOUT = 30.0
+    HTTP_CONNECT_TIMEOUT = 10.0
+    # getUpdates 롱폴링 대기 시간 (초)
+    POLLING_TIMEOUT = 30
+    # 수신할 업데이트 종류 (등록된 핸들러가 처리하는 것만)
+    ALLOWED_UPDATES = [
+        Update.MESSAGE,
+        Update.EDITED_MESSAGE,
+        Update.CHANNEL_POST,
+        Update.EDITED_CHANNEL_POST,
+        Update.CALLBACK_QUERY,
+    ]
+    # 메시지별 매핑(page_id·원본 텍스트·chat_id) 메모리 보관 최대 개수
+    MAPPING_CAPACITY = 10_000
 
     # ── 상가 특징 인라인 키보드 버튼 정의 ──
     # (버튼 표시 텍스트, 노션 저장용 텍스트)
@@ -2869,6 +3310,14 @@ class TelegramNotionBot:
         ("역세권", "역세권"),
     ]
 
+    # MarkdownV2 본문은 이스케이프까지 끝낸 상수로 보관 (전송 시 추가 가공 없음)
+    START_TEXT = (
+        "👋 안녕하세요\\! 부동산 매물 등록 봇입니다\\.\n\n"
+        "사진과 매물 정보를 보내주시면 자동으로 노션에 등록합니다\\.\n"
+        "원본 메시지를 수정하면 노션에도 자동 반영됩니다\\!\n\n"
+        "/help 로 사용법을 확인하세요\\!"
+    )
+
     HELP_TEXT = (
         "🏠 *부동산 매물 등록 봇*\n\n"
         "사진과 함께 아래 형식으로 매물 정보를 보내주세요:\n\n"
@@ -2932,25 +3381,26 @@ class TelegramNotionBot:
             logger.info("단일 DB 모드 (개인 DB 미설정)")
         self.parser = PropertyParser()
         # 미디어 그룹 버퍼
-        self._media_groups: Dict[str, Dict] = {}
+        self._media_groups: Dict[str, _MediaGroup] = {}
         # asyncio 타이머 태스크
-        self._pending_tasks: Dict[str, asyncio.Task] = {}
+        self._media_group_timers: Dict[str, asyncio.TimerHandle] = {}
         # 메시지 ID → 노션 페이지 ID 매핑
-        self._page_mapping: Dict[int, str] = {}
-        # 메시지 ID → 원본 매물 텍스트 (변경 감지용)
-        self._original_texts: Dict[int, str] = {}
-        # 메시지 ID → 채팅 ID (동기화 시 메시지 존재 확인용)
-        self._msg_chat_ids: Dict[int, int] = {}
-        # 동기화 중 플래그 (전달 메시지 무시용)
-        self._sync_in_progress = False
+        # (+ 채팅 ID: 동기화 시 메시지 존재 확인용, 원본 텍스트: 변경 감지용)
+        self._tracks: Dict[int, _Track] = _LRUDict(self.MAPPING_CAPACITY)
+        # file_id → (file_path, 조회 시각) - 같은 사진 재전달 시 getFile 생략
+        self._file_path_cache: Dict[str, Tuple[str, float]] = _LRUDict(
+            self.FILE_PATH_CACHE_SIZE
+        )
+        # Bot API 공용 속도 제한 (동기화 확인·삭제·답장이 같은 한도를 나눠 씀)
+        self._tg_limiter = _TokenBucket(self.TELEGRAM_API_RATE)
         # 채팅별 사진 수집 버퍼 (복수 미디어그룹 + 분리 텍스트 묶음 처리)
-        self._chat_buffers: Dict[int, Dict] = {}
-        # 30초 저장 대기 태스크 (실수 삭제 방지 버퍼)
-        self._save_tasks: Dict[int, asyncio.Task] = {}
-        # 2분 버퍼 만료 태스크
-        self._collect_tasks: Dict[int, asyncio.Task] = {}
-        # 추가사진 버퍼: {orig_msg_id: {"photos": [], "label": str, "page_id": str, "timer_task": Task}}
-        self._extra_photo_buffers: Dict[int, Dict] = {}
+        self._chat_buffers: Dict[int, _ChatBuffer] = {}
+        # 30초 저장 대기 타이머 (실수 삭제 방지 버퍼)
+        self._save_timers: Dict[int, asyncio.TimerHandle] = {}
+        # 2분 버퍼 만료 타이머
+        self._collect_timers: Dict[int, asyncio.TimerHandle] = {}
+        # 추가사진 버퍼: {orig_msg_id: _ExtraPhotoBuf}
+        self._extra_photo_buffers: Dict[int, _ExtraPhotoBuf] = {}
         # 상가 특징 인라인 키보드 선택 상태
         # {chat_id: {"selected": set(), "keyboard_msg_id": int, "finalized": bool}}
         self._feature_selections: Dict[int, Dict] = {}
@@ -2958,6 +3408,16 @@ class TelegramNotionBot:
         # {chat_id: {"chosen": None|"underground"|"ground1",
         #             "confirm_msg_id": int, "original_floor": str}}
         self._basement_selections: Dict[int, Dict] = {}
+        # 채팅별 처리 잠금 (사진/텍스트 핸들러를 비동기로 돌려도 채팅 내 순서 유지)
+        self._chat_locks: Dict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # 타이머에서 띄운 백그라운드 태스크 (참조 유지 → 실행 중 GC 방지)
+        self._background_tasks: set = set()
+        # 한글 명령어 → 핸들러 (첫 토큰 1회 조회로 디스패치)
+        # 영문 명령어는 CommandHandler가 bot_command 엔티티로 처리
+        self._command_table = {
+            "/동기화": self.sync_command,
+            "/매물확인": self.property_check_command,
+        }
 
         # 매핑 파일 (봇 재시작 후에도 page_mapping 유지)
         self._mapping_file = "page_mapping.json"
@@ -2969,15 +3429,28 @@ class TelegramNotionBot:
         self._page_cld_folders: Dict[int, str] = {}
 
         # 매물접수자 이름 목록 (노션 셀렉트 옵션과 일치해야 함)
-        self._staff_names = [
+        # 부분 일치 매칭은 순서대로 검사하므로 tuple 유지, 정확히 일치는 frozenset으로 O(1)
+        self._staff_names = (
             "박진우", "김동영", "임정묵",
             "김태훈", "한지훈", "허종찬", "고동기",
-        ]
-
-        # 동기화용 Notion 속성 초기화
-        self.notion_uploader.ensure_sync_properties()
+        )
+        self._staff_name_set = frozenset(self._staff_names)
+        # 공백 제거한 이름을 미리 계산 (메시지마다 재정규화하지 않음)
+        self._staff_names_norm = tuple(
+            (name, "".join(name.split())) for name in self._staff_names
+        )
+        # 서명 안에 포함된 직원 이름을 한 번의 선형 탐색으로 찾기 위한 오토마톤
+        self._staff_automaton = None
+        if _AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for idx, (_, name_norm) in enumerate(self._staff_names_norm):
+                if name_norm and name_norm not in automaton:
+                    automaton.add_word(name_norm, idx)
+            automaton.make_automaton()
+            self._staff_automaton = automaton
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _normalize_korean_name(name: str) -> str:
         """한국 이름 순서 정규화
 
@@ -2990,7 +3463,7 @@ class TelegramNotionBot:
           - 단어 2개 + 첫 번째가 1글자 → 이미 "성 이름" → 공백만 제거
           - 그 외                       → 공백 제거 후 그대로 사용
         """
-        parts = name.strip().split()
+        parts = name.split()  # 인자 없는 split()은 앞뒤 공백도 무시
         if len(parts) == 2:
             if len(parts[-1]) == 1:
                 # "진우 박" → "박진우"
@@ -2999,7 +3472,7 @@ class TelegramNotionBot:
                 # "박 진우" → "박진우"
                 return parts[0] + parts[1]
         # 공백 모두 제거
-        return re.sub(r"\s+", "", name)
+        return "".join(parts)
 
     def _match_staff_name(self, signature: Optional[str]) -> Optional[str]:
         """채널 서명에서 매물접수자 이름 매칭
@@ -3019,12 +3492,35 @@ class TelegramNotionBot:
         # 한국 이름 순서 정규화 ("진우 박" → "박진우")
         sig_norm = self._normalize_korean_name(sig)
         logger.info(f"서명 매칭 시도: '{sig}' → 정규화: '{sig_norm}'")
-        
-        for name in self._staff_names:
-            name_norm = re.sub(r"\s+", "", name)
-            if name_norm == sig_norm or name_norm in sig_norm or sig_norm in name_norm:
-                logger.info(f"매칭 성공: '{sig}' → '{name}'")
-                return name
+
+        if sig_norm in self._staff_name_set:
+            logger.info(f"매칭 성공: '{sig}' → '{sig_norm}'")
+            return sig_norm
+
+        if self._staff_automaton is not None:
+            # 서명에 포함된 이름은 오토마톤 한 번으로 수집, 역방향(서명 ⊂ 이름)만 개별 검사
+            hits = {idx for _, idx in self._staff_automaton.iter(sig_norm)}
+            sig_len = len(sig_norm)
+            for idx, (name, name_norm) in enumerate(self._staff_names_norm):
+                if idx in hits or (
+                    sig_len < len(name_norm) and sig_norm in name_norm
+                ):
+                    logger.info(f"매칭 성공: '{sig}' → '{name}'")
+                    return name
+        else:
+            # 부분 문자열은 짧은 쪽만 긴 쪽에 포함될 수 있으므로 길이로 검사 방향 결정
+            sig_len = len(sig_norm)
+            for name, name_norm in self._staff_names_norm:
+                name_len = len(name_norm)
+                if name_len == sig_len:
+                    matched = name_norm == sig_norm
+                elif name_len < sig_len:
+                    matched = name_norm in sig_norm
+                else:
+                    matched = sig_norm in name_norm
+                if matched:
+                    logger.info(f"매칭 성공: '{sig}' → '{name}'")
+                    return name
         
         # 미리 등록된 이름과 매칭 안 되면 정규화된 서명을 그대로 사용
         logger.info(f"이름 목록 미매칭, 정규화 서명 저장: '{sig_norm}'")
@@ -3037,7 +3533,7 @@ class TelegramNotionBot:
     @staticmethod
     def _is_contact_line(line: str) -> bool:
         """연락처 줄 여부 판별 (전화번호 패턴 포함 시 True)"""
-        return bool(re.search(r'\d{2,3}[-\s]?\d{3,4}[-\s]?\d{4}', line))
+        return bool(_CONTACT_RE.search(line))
 
     @staticmethod
     def _reorder_section9(description: str) -> str:
@@ -3064,9 +3560,9 @@ class TelegramNotionBot:
         line9_idx = None
         for i, line in enumerate(lines):
             stripped = line.strip()
-            if line8_idx is None and re.match(r'^8\.', stripped):
+            if line8_idx is None and stripped.startswith("8."):
                 line8_idx = i
-            if line9_idx is None and re.match(r'^9\.', stripped):
+            if line9_idx is None and stripped.startswith("9."):
                 line9_idx = i
 
         # 9번이 없거나 이미 8번 바로 다음이면 그대로
@@ -3224,8 +3720,8 @@ class TelegramNotionBot:
     @staticmethod
     def _detect_basement_floor(description: str) -> Optional[str]:
         """주소 첫 줄에서 지하층 표기 감지 → '지하N층' 반환, 없으면 None"""
-        first_line = description.strip().split("\n")[0]
-        m = re.search(r'(지하\s*\d+\s*층)', first_line)
+        first_line = description.strip().partition("\n")[0]
+        m = _BASEMENT_RE.search(first_line)
         return m.group(1).replace(" ", "") if m else None
 
     async def _send_basement_confirm(
@@ -3337,6 +3833,7 @@ class TelegramNotionBot:
         )
 
     @staticmethod
+    @lru_cache(maxsize=2048)
     def _is_listing_format(
         text: str, is_update: bool = False
     ) -> bool:
@@ -3355,7 +3852,7 @@ class TelegramNotionBot:
         if len(text) < min_len:
             return False
         # 번호 형식 (1.~8.) 체크
-        if any(f"{i}." in text for i in range(1, 9)):
+        if _NUM_PREFIX_RE.search(text):
             return True
         # 수정 모드에서는 "특이사항" 키워드도 허용
         if is_update and "특이사항" in text:
@@ -3370,21 +3867,26 @@ class TelegramNotionBot:
 
     @staticmethod
     async def _safe_edit_message(
-        message, property_text: str, notion_section_html: str,
-        notion_section_plain: str, is_caption: bool = False,
+        message, property_text: str, page_url: str, page_id: str,
+        update_log: str = "", is_caption: bool = False,
     ):
         """HTML 모드로 메시지 수정 시도 → 실패 시 plain text fallback
 
+        노션 섹션은 실제로 시도하는 모드의 것만 생성.
+
         Args:
             message: 텔레그램 메시지 객체
             property_text: 매물 정보 원본 텍스트
-            notion_section_html: HTML 하이퍼링크 포함 노션 섹션
-            notion_section_plain: plain text 노션 섹션 (fallback)
+            page_url: 노션 페이지 URL
+            page_id: 노션 페이지 ID
+            update_log: 노션 섹션에 붙일 수정 이력 문자열
             is_caption: True면 edit_caption, False면 edit_text
         """
         # HTML 모드: 매물 텍스트를 이스케이프하고 노션 섹션은 HTML 유지
-        escaped_text = html.escape(property_text)
-        html_full = escaped_text + notion_section_html
+        escaped_text = _escape_cached(property_text)
+        html_full = escaped_text + TelegramNotionBot._build_notion_section(
+            page_url, page_id, update_log, use_html=True,
+        )
 
         try:
             if is_caption:
@@ -3399,7 +3901,9 @@ class TelegramNotionBot:
         except Exception as e:
             logger.warning(f"HTML 모드 실패, plain text로 전환: {e}")
             # Fallback: plain text (기존 방식)
-            plain_full = property_text + notion_section_plain
+            plain_full = property_text + TelegramNotionBot._build_notion_section(
+                page_url, page_id, update_log, use_html=False,
+            )
             try:
                 if is_caption:
                     await message.edit_caption(caption=plain_full)
@@ -3413,9 +3917,7 @@ class TelegramNotionBot:
     @staticmethod
     def _extract_property_text(message_text: str) -> str:
         """메시지에서 구분선 위쪽(매물 정보)만 추출"""
-        if TelegramNotionBot.DIVIDER in message_text:
-            return message_text.split(TelegramNotionBot.DIVIDER)[0].strip()
-        return message_text.strip()
+        return message_text.partition(TelegramNotionBot.DIVIDER)[0].strip()
 
     @staticmethod
     def _build_notion_section(
@@ -3445,6 +3947,37 @@ class TelegramNotionBot:
             section += f"\n{update_log}"
         return section
 
+    # 수정 요약에 표시할 필드 (데이터 키, 표시 라벨) — 순서대로 요약에 나열
+    _FIELD_LABELS = (
+        ("주소", "주소"),
+        ("층수", "층수"),
+        ("보증금", "보증금"),
+        ("월세", "월세"),
+        ("부가세", "부가세"),
+        ("관리비", "관리비"),
+        ("권리금", "권리금"),
+        ("건축물용도", "용도"),
+        ("계약면적", "계약㎡"),
+        ("전용면적", "전용㎡"),
+        ("주차", "주차"),
+        ("방향", "방향"),
+        ("화장실 위치", "화장실위치"),
+        ("화장실 수", "화장실"),
+        ("화장실 형태", "화장실형태"),
+        ("위반건축물", "위반"),
+        ("대표 연락처", "연락처"),
+        ("매물_유형", "매물유형"),
+        ("소재지_구", "소재지"),
+        ("임대_구분", "임대구분"),
+    )
+
+    @staticmethod
+    def _to_str(v) -> str:
+        """요약 비교용 문자열 변환 (리스트(multi_select)는 쉼표로 연결)"""
+        if isinstance(v, list):
+            return ", ".join(str(x) for x in v)
+        return str(v) if v is not None else ""
+
     @staticmethod
     def _build_update_summary(
         old_data: Dict, new_data: Dict
@@ -3453,41 +3986,25 @@ class TelegramNotionBot:
         예: 월세55→65, 보증금1000→2000
         """
         changes = []
-        field_names = {
-            "주소": "주소",
-            "층수": "층수",
-            "보증금": "보증금",
-            "월세": "월세",
-            "부가세": "부가세",
-            "관리비": "관리비",
-            "권리금": "권리금",
-            "건축물용도": "용도",
-            "계약면적": "계약㎡",
-            "전용면적": "전용㎡",
-            "주차": "주차",
-            "방향": "방향",
-            "화장실 위치": "화장실위치",
-            "화장실 수": "화장실",
-            "화장실 형태": "화장실형태",
-            "위반건축물": "위반",
-            "대표 연락처": "연락처",
-            "매물_유형": "매물유형",
-            "소재지_구": "소재지",
-            "임대_구분": "임대구분",
-        }
-        
-        for key, label in field_names.items():
+        _to_str = TelegramNotionBot._to_str
+
+        for key, label in TelegramNotionBot._FIELD_LABELS:
             if key not in new_data:
                 continue
             new_val = new_data[key]
             old_val = old_data.get(key)
-            
-            # 리스트(multi_select) 타입 처리 (건축물용도 등)
-            def _to_str(v):
-                if isinstance(v, list):
-                    return ", ".join(str(x) for x in v)
-                return str(v) if v is not None else ""
-            
+
+            # 같은 객체면 변경 없음 (None→None은 아래 "새로 추가" 규칙 유지)
+            if old_val is new_val and old_val is not None:
+                continue
+            # 문자열 길이가 다르면 내용 비교 없이 변경으로 처리
+            if (
+                type(old_val) is str and type(new_val) is str
+                and len(old_val) != len(new_val)
+            ):
+                changes.append(f"{label}{old_val}→{new_val}")
+                continue
+
             # 숫자 비교
             if isinstance(old_val, (int, float)) and isinstance(new_val, (int, float)):
                 if old_val != new_val:
@@ -3523,16 +4040,12 @@ class TelegramNotionBot:
     # (복수 미디어그룹 + 사진/텍스트 분리 업로드 지원)
     # ──────────────────────────────────────────────
 
-    def _get_or_create_buffer(self, chat_id: int) -> Dict:
+    def _get_or_create_buffer(self, chat_id: int) -> _ChatBuffer:
         """채팅별 사진 버퍼 가져오기 (없으면 생성)"""
-        if chat_id not in self._chat_buffers:
-            self._chat_buffers[chat_id] = {
-                # 층별 사진 그룹: [{"label": "1층"|None, "photos": [...]}]
-                "floor_groups": [{"label": None, "photos": []}],
-                "first_message": None,
-                "author_signature": None,
-            }
-        return self._chat_buffers[chat_id]
+        buf = self._chat_buffers.get(chat_id)
+        if buf is None:
+            buf = self._chat_buffers[chat_id] = _ChatBuffer()
+        return buf
 
     def _add_photos_to_buffer(
         self,
@@ -3545,7 +4058,7 @@ class TelegramNotionBot:
         buf = self._get_or_create_buffer(chat_id)
 
         # 작성자가 변경되면 기존 버퍼 초기화 (다른 사람의 사진이 섞이는 것 방지)
-        existing_author = buf.get("author_signature")
+        existing_author = buf.author_signature
         if (
             author_sig
             and existing_author
@@ -3553,7 +4066,7 @@ class TelegramNotionBot:
         ):
             old_photo_count = sum(
                 len(g.get("photos", []))
-                for g in buf.get("floor_groups", [])
+                for g in buf.floor_groups
             )
             logger.info(
                 f"작성자 변경 감지: '{existing_author}' → '{author_sig}', "
@@ -3563,22 +4076,16 @@ class TelegramNotionBot:
             buf = self._get_or_create_buffer(chat_id)
 
         # floor_groups 마지막 그룹에 사진 추가
-        floor_groups = buf.setdefault(
-            "floor_groups", [{"label": None, "photos": []}]
-        )
-        floor_groups[-1]["photos"].extend(photos)
+        if not buf.floor_groups:
+            buf.floor_groups = _new_floor_groups()
+        buf.floor_groups[-1]["photos"].extend(photos)
 
-        if buf["first_message"] is None:
-            buf["first_message"] = message
+        if buf.first_message is None:
+            buf.first_message = message
         if author_sig:
-            buf["author_signature"] = author_sig
-        # 기존 만료 태스크 취소 후 재시작
-        existing = self._collect_tasks.get(chat_id)
-        if existing:
-            existing.cancel()
-        self._collect_tasks[chat_id] = asyncio.create_task(
-            self._expire_chat_buffer(chat_id)
-        )
+            buf.author_signature = author_sig
+        # 기존 만료 타이머 취소 후 재시작
+        self._reset_collect_timer(chat_id)
 
     def _add_floor_label_to_buffer(self, chat_id: int, label: str):
         """버퍼에 층수 라벨 추가 → 사진 그룹 구분
@@ -3589,15 +4096,12 @@ class TelegramNotionBot:
             "1층" → [사진 10장] → "2층" → [사진 12장] → [매물설명]
         """
         buf = self._chat_buffers.get(chat_id)
-        if not buf:
+        if buf is None:
             return
 
-        floor_groups = buf.get(
-            "floor_groups", [{"label": None, "photos": []}]
-        )
+        floor_groups = buf.floor_groups
         if not floor_groups:
-            floor_groups = [{"label": None, "photos": []}]
-            buf["floor_groups"] = floor_groups
+            floor_groups = buf.floor_groups = _new_floor_groups()
 
         last_group = floor_groups[-1]
 
@@ -3616,19 +4120,30 @@ class TelegramNotionBot:
             f"floor_groups={len(floor_groups)}개 (chat_id={chat_id})"
         )
 
-    async def _expire_chat_buffer(self, chat_id: int):
-        """2분 후 채팅 버퍼 자동 만료 (매물 설명 없으면 사진 폐기)"""
-        await asyncio.sleep(self.PROPERTY_COLLECT_WINDOW)
+    def _reset_collect_timer(self, chat_id: int):
+        """채팅 버퍼 만료 타이머 (재)설정
+
+        사진마다 태스크를 만들고 취소하는 대신 call_later 핸들만 교체.
+        """
+        existing = self._collect_timers.pop(chat_id, None)
+        if existing:
+            existing.cancel()
+        self._collect_timers[chat_id] = asyncio.get_running_loop().call_later(
+            self.PROPERTY_COLLECT_WINDOW, self._expire_chat_buffer, chat_id
+        )
+
+    def _expire_chat_buffer(self, chat_id: int):
+        """만료 타이머 도달 시 채팅 버퍼 정리 (매물 설명 없으면 사진 폐기)"""
         self._chat_buffers.pop(chat_id, None)
-        self._collect_tasks.pop(chat_id, None)
+        self._collect_timers.pop(chat_id, None)
         logger.debug(f"채팅 버퍼 만료: chat_id={chat_id}")
 
     def _clear_chat_buffer(self, chat_id: int):
         """채팅 버퍼 즉시 정리"""
         self._chat_buffers.pop(chat_id, None)
-        task = self._collect_tasks.pop(chat_id, None)
-        if task:
-            task.cancel()
+        timer = self._collect_timers.pop(chat_id, None)
+        if timer:
+            timer.cancel()
 
     async def _schedule_property_save(
         self,
@@ -3638,14 +4153,14 @@ class TelegramNotionBot:
         context,
     ):
         """30초 후 매물 저장 예약 (실수 삭제 방지 버퍼)"""
-        # 기존 저장 태스크 취소 (같은 채팅에서 새 매물 설명이 오면 덮어쓰기)
-        existing = self._save_tasks.get(chat_id)
+        # 기존 저장 타이머 취소 (같은 채팅에서 새 매물 설명이 오면 덮어쓰기)
+        existing = self._save_timers.pop(chat_id, None)
         if existing:
             existing.cancel()
-        self._save_tasks[chat_id] = asyncio.create_task(
-            self._do_save_with_buffer(
-                chat_id, description, trigger_message, context.bot
-            )
+        self._save_timers[chat_id] = asyncio.get_running_loop().call_later(
+            self.PROPERTY_SAVE_BUFFER,
+            self._start_buffered_save,
+            chat_id, description, trigger_message, context.bot,
         )
         logger.debug(
             f"매물 저장 예약: chat_id={chat_id}, "
@@ -3654,7 +4169,7 @@ class TelegramNotionBot:
 
         # ── 9번 항목(상가 특징)이 없으면 인라인 키보드 제안 ──
         has_section9 = bool(
-            re.search(r'(?:^|\n)\s*9\.', description)
+            _SECTION9_RE.search(description)
         )
         if not has_section9:
             await self._send_feature_keyboard(
@@ -3668,6 +4183,39 @@ class TelegramNotionBot:
                 chat_id, basement_floor, context
             )
 
+    def _start_buffered_save(
+        self,
+        chat_id: int,
+        description: str,
+        trigger_message,
+        bot,
+    ):
+        """저장 대기 타이머 만료 → 저장 태스크 시작"""
+        self._save_timers.pop(chat_id, None)
+        self._spawn(
+            self._do_save_with_buffer(
+                chat_id, description, trigger_message, bot
+            )
+        )
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """백그라운드 태스크 시작 (완료 시 참조 해제 + 예외 로그)"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_background_task_done)
+        return task
+
+    def _on_background_task_done(self, task: asyncio.Task):
+        self._background_tasks.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.error(
+                f"백그라운드 태스크 오류: {exc}",
+                exc_info=(type(exc), exc, exc.__traceback__),
+            )
+
     async def _do_save_with_buffer(
         self,
         chat_id: int,
@@ -3675,9 +4223,7 @@ class TelegramNotionBot:
         trigger_message,
         bot,
     ):
-        """30초 대기 → 트리거 메시지 존재 확인 → 저장 실행"""
-        await asyncio.sleep(self.PROPERTY_SAVE_BUFFER)
-        self._save_tasks.pop(chat_id, None)
+        """(30초 대기 후) 트리거 메시지 존재 확인 → 저장 실행"""
 
         try:
             await self._do_save_with_buffer_inner(
@@ -3747,11 +4293,8 @@ class TelegramNotionBot:
                     pass
             # "지상 1층에 위치" 선택 시 → 주소의 지하N층을 1층으로 교체
             if basement_sel.get("chosen") == "ground1":
-                description = re.sub(
-                    r'지하\s*\d+\s*층',
-                    '1층',
-                    description,
-                    count=1,
+                description = _BASEMENT_RE.sub(
+                    '1층', description, count=1
                 )
 
         # 상가 특징 선택 결과 가져오기
@@ -3769,9 +4312,11 @@ class TelegramNotionBot:
             description = description.rstrip() + "\n" + line9
 
         # 버퍼에서 사진 & 층별 그룹 가져오기
-        buf = self._chat_buffers.get(chat_id, {})
-        floor_groups = buf.get("floor_groups", [])
-        buf_author = buf.get("author_signature")
+        buf = self._chat_buffers.get(chat_id)
+        if buf is None:
+            buf = _ChatBuffer(floor_groups=[])
+        floor_groups = buf.floor_groups
+        buf_author = buf.author_signature
         trigger_author = getattr(
             trigger_message, "author_signature", None
         )
@@ -3792,7 +4337,7 @@ class TelegramNotionBot:
             author_sig = trigger_author
 
         # 첫 사진 메시지 (추가사진 답장 탐색에 사용)
-        first_photo_msg = buf.get("first_message")
+        first_photo_msg = buf.first_message
 
         # 전체 사진 URL 목록 (flat)
         photo_urls: List[str] = []
@@ -3834,14 +4379,11 @@ class TelegramNotionBot:
         """
         if not text:
             return False, None
-        m = re.search(
-            r'[\(\[]\s*(?:계약|거래)\s*완료\s*([^\)\]]*)\s*[\)\]]',
-            text,
-        )
+        m = _DEAL_RE.search(text)
         if m:
             agent_raw = m.group(1).strip()
             # 공백 정규화 (앞뒤 공백 제거, 내부 다중 공백 단일화)
-            agent_clean = re.sub(r'\s+', ' ', agent_raw).strip()
+            agent_clean = _WS_RE.sub(' ', agent_raw).strip()
             return True, agent_clean if agent_clean else None
         return False, None
 
@@ -3862,7 +4404,7 @@ class TelegramNotionBot:
         if not reply:
             return
 
-        page_id = self._get_page_id_from_reply(reply)
+        page_id = await self._get_page_id_from_reply(reply)
         if not page_id:
             logger.debug(
                 f"거래완료 답장: 연결된 노션 페이지 없음 "
@@ -3870,9 +4412,17 @@ class TelegramNotionBot:
             )
             return
 
-        success = self.notion_uploader.update_deal_status(
-            page_id, agent_name
+        success = await asyncio.to_thread(
+            self.notion_uploader.update_deal_status, page_id, agent_name
         )
+        if not success:
+            # 아카이브된 페이지였다면 DB 재조회로 살아 있는 페이지에 재시도
+            page_id = await self._refind_page_id(reply.message_id, page_id)
+            if page_id:
+                success = await asyncio.to_thread(
+                    self.notion_uploader.update_deal_status,
+                    page_id, agent_name,
+                )
         if success:
             result_msg = "✅ 거래 완료 처리됐습니다."
             if agent_name:
@@ -3930,14 +4480,14 @@ class TelegramNotionBot:
                 break
 
         if notion_url and self.DIVIDER in escaped_new_text:
-            parts = escaped_new_text.split(html.escape(self.DIVIDER), 1)
-            below = parts[1] if len(parts) > 1 else ""
+            escaped_divider = _escape_cached(self.DIVIDER)
+            above, _, below = escaped_new_text.partition(escaped_divider)
             # "✅ Notion" 텍스트를 HTML 하이퍼링크로 변환
             below = below.replace(
                 "✅ Notion",
                 f'✅ <a href="{notion_url}">Notion</a>',
             )
-            escaped_new_text = parts[0] + html.escape(self.DIVIDER) + below
+            escaped_new_text = above + escaped_divider + below
 
         try:
             if is_caption:
@@ -3992,37 +4542,65 @@ class TelegramNotionBot:
 
     def _load_page_mapping(self):
         """파일에서 page_mapping 로드"""
-        import json as _json
         try:
             with open(self._mapping_file, "r", encoding="utf-8") as f:
                 data = _json.load(f)
             # JSON key는 str → int로 변환
-            self._page_mapping = {int(k): v for k, v in data.items()}
-            logger.info(f"page_mapping 로드 완료: {len(self._page_mapping)}개")
+            self._tracks = _LRUDict(
+                self.MAPPING_CAPACITY,
+                ((int(k), _Track(v)) for k, v in data.items()),
+            )
+            logger.info(f"page_mapping 로드 완료: {len(self._tracks)}개")
         except FileNotFoundError:
             logger.info("page_mapping 파일 없음, 빈 상태로 시작")
         except Exception as e:
             logger.warning(f"page_mapping 로드 실패: {e}")
 
+    async def _tg(self, coro):
+        """Bot API 호출 코루틴을 공용 속도 제한을 거쳐 실행"""
+        async with self._tg_limiter:
+            return await coro
+
+    def _page_id_of(self, msg_id: int) -> Optional[str]:
+        """메시지 ID → 노션 page_id (메모리 매핑에 없으면 None)"""
+        track = self._tracks.get(msg_id)
+        return track.page_id if track is not None else None
+
+    def _track_page(
+        self, msg_id: int, page_id: str, chat_id: Optional[int] = None,
+        text: Optional[str] = None,
+    ) -> _Track:
+        """메시지 ↔ 노션 페이지 매핑 기록 (chat_id·text는 주어진 경우만 갱신)"""
+        track = self._tracks.get(msg_id)
+        if track is None:
+            track = self._tracks[msg_id] = _Track(page_id)
+        else:
+            track.page_id = page_id
+            self._tracks.touch(msg_id)
+        if chat_id is not None:
+            track.chat_id = chat_id
+        if text is not None:
+            track.text = text
+        return track
+
     def _save_page_mapping(self):
         """page_mapping을 파일에 저장"""
-        import json as _json
         try:
             with open(self._mapping_file, "w", encoding="utf-8") as f:
                 _json.dump(
-                    {str(k): v for k, v in self._page_mapping.items()},
+                    {str(k): t.page_id for k, t in self._tracks.items()},
                     f, ensure_ascii=False, indent=2,
                 )
         except Exception as e:
             logger.warning(f"page_mapping 저장 실패: {e}")
 
-    def _get_page_id_from_reply(
+    async def _get_page_id_from_reply(
         self, reply_message
     ) -> Optional[str]:
         """답장 대상 메시지에서 노션 페이지 ID 추출
 
         탐색 순서:
-          1. 메모리 매핑 (_page_mapping)
+          1. 메모리 매핑 (_tracks)
           2. 메시지 entities의 Notion text_link URL
           3. 노션 DB에서 telegram_msg_id로 검색
           4. 메시지 첫 줄(주소)로 노션 DB 검색 (최종 폴백)
@@ -4030,8 +4608,9 @@ class TelegramNotionBot:
         msg_id = reply_message.message_id
 
         # 1. 저장된 매핑에서 찾기
-        if msg_id in self._page_mapping:
-            return self._page_mapping[msg_id]
+        page_id = self._page_id_of(msg_id)
+        if page_id is not None:
+            return page_id
 
         # 2. HTML 하이퍼링크 entities에서 Notion URL 추출
         entities = (
@@ -4040,40 +4619,39 @@ class TelegramNotionBot:
             or []
         )
         for ent in entities:
-            if ent.type == "text_link" and ent.url and "notion.so" in ent.url:
-                match = re.search(r'([a-f0-9]{32})', ent.url)
+            if not (ent.type == "text_link" and ent.url):
+                continue
+            marker = ent.url.find("notion.so")
+            if marker >= 0:
+                # "notion.so" 이후 구간에서만 page_id 탐색
+                match = _PAGE_ID_RE.search(ent.url, marker)
                 if match:
                     raw_id = match.group(1)
-                    page_id = (
-                        f"{raw_id[:8]}-{raw_id[8:12]}"
-                        f"-{raw_id[12:16]}"
-                        f"-{raw_id[16:20]}-{raw_id[20:]}"
-                    )
+                    page_id = _hyphenate(raw_id)
                     # 캐시에 저장
-                    self._page_mapping[msg_id] = page_id
+                    self._track_page(msg_id, page_id)
                     self._save_page_mapping()
                     logger.info(f"entities에서 page_id 복구: msg_id={msg_id}")
                     return page_id
 
         # 3. 텍스트에 직접 Notion URL이 포함된 경우 (plain text 폴백)
         text = reply_message.text or reply_message.caption or ""
-        if "notion.so" in text:
-            match = re.search(r'notion\.so/[^\s]*?([a-f0-9]{32})', text)
+        marker = text.find("notion.so")
+        if marker >= 0:
+            match = _NOTION_URL_ID_RE.search(text, marker)
             if match:
                 raw_id = match.group(1)
-                page_id = (
-                    f"{raw_id[:8]}-{raw_id[8:12]}"
-                    f"-{raw_id[12:16]}"
-                    f"-{raw_id[16:20]}-{raw_id[20:]}"
-                )
-                self._page_mapping[msg_id] = page_id
+                page_id = _hyphenate(raw_id)
+                self._track_page(msg_id, page_id)
                 self._save_page_mapping()
                 return page_id
 
         # 4. Notion DB에서 telegram_msg_id로 검색
-        page_id = self.notion_uploader.find_page_by_msg_id(msg_id)
+        page_id = await asyncio.to_thread(
+            self.notion_uploader.find_page_by_msg_id, msg_id
+        )
         if page_id:
-            self._page_mapping[msg_id] = page_id
+            self._track_page(msg_id, page_id)
             self._save_page_mapping()
             logger.info(f"Notion DB msg_id 검색으로 page_id 복구: msg_id={msg_id}")
             return page_id
@@ -4082,14 +4660,16 @@ class TelegramNotionBot:
         #    봇 재시작 후 reply_to_message에 entities 없을 때도 동작
         if text:
             # DIVIDER 이전 내용만 사용 (노션 링크 섹션 제거)
-            content = text.split(self.DIVIDER)[0].strip()
-            first_line = content.split("\n")[0].strip()
+            content = text.partition(self.DIVIDER)[0].strip()
+            first_line = content.partition("\n")[0].strip()
             # 너무 짧거나 명령어이면 스킵
             if len(first_line) >= 5 and not first_line.startswith("/"):
-                pages = self.notion_uploader.find_pages_by_address(first_line)
+                pages = await asyncio.to_thread(
+                    self.notion_uploader.find_pages_by_address, first_line
+                )
                 if len(pages) == 1:
                     page_id = pages[0]["page_id"]
-                    self._page_mapping[msg_id] = page_id
+                    self._track_page(msg_id, page_id)
                     self._save_page_mapping()
                     logger.info(
                         f"주소 검색으로 page_id 복구: "
@@ -4099,7 +4679,7 @@ class TelegramNotionBot:
                 elif len(pages) > 1:
                     # 여러 개 히트: 가장 최근 것 선택 (Notion 기본 정렬: 생성 역순)
                     page_id = pages[0]["page_id"]
-                    self._page_mapping[msg_id] = page_id
+                    self._track_page(msg_id, page_id)
                     self._save_page_mapping()
                     logger.info(
                         f"주소 검색 복수 결과, 최신 사용: "
@@ -4122,19 +4702,15 @@ class TelegramNotionBot:
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """채널 메시지 수정 감지 및 노션 자동 업데이트"""
-        # 수정된 메시지가 아니면 무시 (group=1에서 모든 업데이트를 받으므로)
-        if not (update.edited_channel_post or update.edited_message):
-            return
-        
         message = update.effective_message
         if not message:
             return
-        
         msg_id = message.message_id
         current_text = message.text or message.caption or ""
         
         # 매핑된 페이지가 없으면 메시지에서 복구 시도
-        if msg_id not in self._page_mapping:
+        page_id = self._page_id_of(msg_id)
+        if page_id is None:
             if self.DIVIDER not in current_text:
                 return
             
@@ -4153,33 +4729,31 @@ class TelegramNotionBot:
             if not notion_url:
                 return
             
-            match = re.search(r'([a-f0-9]{32})', notion_url)
+            # notion_url에는 항상 "notion.so"가 포함됨 → 그 위치부터 탐색
+            match = _PAGE_ID_RE.search(
+                notion_url, notion_url.find("notion.so")
+            )
             if match:
                 raw_id = match.group(1)
-                page_id = (
-                    f"{raw_id[:8]}-{raw_id[8:12]}"
-                    f"-{raw_id[12:16]}"
-                    f"-{raw_id[16:20]}-{raw_id[20:]}"
-                )
-                self._page_mapping[msg_id] = page_id
-                self._msg_chat_ids[msg_id] = message.chat_id
+                page_id = _hyphenate(raw_id)
+                self._track_page(msg_id, page_id, chat_id=message.chat_id)
                 logger.info(
                     f"매핑 복구: msg_id={msg_id} → {page_id}"
                 )
             else:
                 return
         
-        page_id = self._page_mapping[msg_id]
-        
         # 구분선으로 매물 정보만 추출
         property_text = self._extract_property_text(current_text)
         
         # 이전 매물 텍스트와 비교 (매핑 복구 시 이전 텍스트 없으면 무조건 업데이트)
-        old_property_text = self._original_texts.get(msg_id, "")
+        track = self._tracks.get(msg_id)
+        old_property_text = (
+            track.text if track is not None and track.text is not None else ""
+        )
         
         # 거래 완료 체크 (전체 메시지에서 체크 - 구분선 아래 포함)
-        current_text_no_space = current_text.replace(" ", "").replace("\n", "")
-        has_deal_completed = "거래완료" in current_text_no_space or "계약완료" in current_text_no_space
+        has_deal_completed = bool(_DEAL_FOUND_RE.search(current_text))
         
         # 변경 없고 거래완료도 없으면 무시
         if property_text == old_property_text and not has_deal_completed:
@@ -4194,7 +4768,9 @@ class TelegramNotionBot:
         
         try:
             # 기존 노션 데이터 조회
-            old_data = self.notion_uploader.get_page_properties(page_id)
+            old_data = await asyncio.to_thread(
+                self.notion_uploader.get_page_properties, page_id
+            )
             
             # 수정된 매물 정보 파싱 (주소 포함)
             new_property_data = {}
@@ -4202,8 +4778,10 @@ class TelegramNotionBot:
                 # 9번 항목 재정렬 후 파싱 (특이사항이 중간에 껴서 9번이 누락되는 것 방지)
                 reordered_text = self._reorder_section9(property_text)
                 # 매물 정보가 변경된 경우에만 파싱
-                new_property_data = self.parser.parse_property_info(
-                    reordered_text, skip_address=False
+                # 파싱은 CPU 작업이므로 스레드에서 실행 (이벤트 루프 블로킹 방지)
+                new_property_data = await asyncio.to_thread(
+                    self.parser.parse_property_info,
+                    reordered_text, skip_address=False,
                 )
                 if not new_property_data:
                     new_property_data = {}
@@ -4222,8 +4800,7 @@ class TelegramNotionBot:
                 if old_data.get("거래_상태") != "거래 완료":
                     new_property_data["거래_상태"] = "거래 완료"
                     # 거래완료 시점 기록
-                    now = datetime.now()
-                    new_property_data["거래완료_시점"] = now.strftime("%Y-%m-%d %H:%M")
+                    new_property_data["거래완료_시점"] = _now_stamps()[1]
                     logger.info(f"거래 완료 감지: msg_id={msg_id}, 시점={new_property_data['거래완료_시점']}")
             
             # 노션에 업데이트할 내용이 없으면 종료
@@ -4231,49 +4808,45 @@ class TelegramNotionBot:
                 return
             
             # 노션 업데이트
-            page_url = self.notion_uploader.update_property(
-                page_id, new_property_data
+            page_url = await asyncio.to_thread(
+                self.notion_uploader.update_property,
+                page_id, new_property_data,
             )
             
             # 노션 '원본 메시지' 블록도 갱신
             if property_text != old_property_text:
-                self.notion_uploader.update_original_message_block(
-                    page_id, property_text
+                await asyncio.to_thread(
+                    self.notion_uploader.update_original_message_block,
+                    page_id, property_text,
                 )
             
             # 변경 요약 생성
             summary = self._build_update_summary(old_data, new_property_data)
-            now = datetime.now().strftime("%m/%d %H:%M")
+            now = time.strftime("%m/%d %H:%M")
             update_log = f"🔄 {now} {summary}"
             
             # 기존 수정 이력 유지
             existing_logs = ""
             if self.DIVIDER in current_text:
-                below_divider = current_text.split(self.DIVIDER, 1)[1]
-                for line in below_divider.split("\n"):
-                    if line.strip().startswith("🔄"):
-                        existing_logs += f"\n{line.strip()}"
+                below_divider = current_text.partition(self.DIVIDER)[2]
+                existing_logs = "".join(
+                    f"\n{log.rstrip()}"
+                    for log in _LOG_LINE_RE.findall(below_divider)
+                )
             
             # 원본 메시지에 수정 이력 추가
             all_logs = update_log
             if existing_logs:
                 all_logs += existing_logs
             
-            notion_html = self._build_notion_section(
-                page_url, page_id, all_logs, use_html=True
-            )
-            notion_plain = self._build_notion_section(
-                page_url, page_id, all_logs, use_html=False
-            )
-            
             # 현재 텍스트를 저장 (다음 비교용) - 수정 전에 저장
-            self._original_texts[msg_id] = property_text
+            self._track_page(msg_id, page_id, text=property_text)
             
             # 메시지 수정 (HTML 시도 → 실패 시 plain text)
             is_caption = message.caption is not None
             await self._safe_edit_message(
                 message, property_text,
-                notion_html, notion_plain,
+                page_url, page_id, all_logs,
                 is_caption=is_caption,
             )
             
@@ -4296,17 +4869,34 @@ class TelegramNotionBot:
     # 명령어 핸들러
     # ──────────────────────────────────────────────
 
+    async def _dispatch_command(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE
+    ):
+        """첫 토큰으로 한글 명령어 표를 조회해 실행 (일반 메시지 + 채널 포스트)
+
+        텔레그램은 한글 명령어에 bot_command 엔티티를 붙이지 않으므로
+        CommandHandler 대신 직접 조회.
+        명령어가 아니면 그대로 반환 → 다른 핸들러가 이어서 처리.
+        명령어를 처리했으면 이후 핸들러 그룹은 실행하지 않음.
+        """
+        text = update.effective_message.text
+        if not text or text[0] != "/":
+            return
+        # "/delete@봇이름 ..." → "/delete"
+        command = text.split(None, 1)[0].partition("@")[0]
+        handler = self._command_table.get(command)
+        if handler is None:
+            return
+        await handler(update, context)
+        raise ApplicationHandlerStop
+
     async def start_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         message = update.effective_message
         if message:
             await message.reply_text(
-                "👋 안녕하세요\\! 부동산 매물 등록 봇입니다\\.\n\n"
-                "사진과 매물 정보를 보내주시면 자동으로 노션에 등록합니다\\.\n"
-                "원본 메시지를 수정하면 노션에도 자동 반영됩니다\\!\n\n"
-                "/help 로 사용법을 확인하세요\\!",
-                parse_mode="MarkdownV2",
+                self.START_TEXT, parse_mode="MarkdownV2"
             )
 
     async def help_command(
@@ -4333,7 +4923,9 @@ class TelegramNotionBot:
             )
 
             # ── 1단계: 노션에서 추적 중인 모든 매물 조회 ──
-            tracked_pages = self.notion_uploader.get_tracked_pages()
+            tracked_pages = await asyncio.to_thread(
+                self.notion_uploader.get_tracked_pages
+            )
             notion_map = {}  # {msg_id: {"page_id": ..., "title": ...}}
             for page in tracked_pages:
                 notion_map[page["msg_id"]] = {
@@ -4343,46 +4935,54 @@ class TelegramNotionBot:
                 }
 
             # ── 2단계: 메모리 매핑 추가 (봇이 업로드한 매물) ──
-            all_msg_ids = set(notion_map.keys()) | set(self._page_mapping.keys())
+            all_msg_ids = set(notion_map.keys()) | set(self._tracks.keys())
 
             telegram_exists = {}  # {msg_id: bool}
             notion_only = []  # [(title, page_id)]
             telegram_only = []  # [(msg_id, title)]
 
-            # ── 3단계: 각 메시지 존재 여부 확인 ──
+            # ── 3단계: 각 메시지 존재 여부 확인 (최대 20개 병렬) ──
+            sem = asyncio.Semaphore(20)
             checked = 0
-            for msg_id in all_msg_ids:
-                checked += 1
-                
+
+            async def _check_one(msg_id: int) -> None:
+                nonlocal checked
                 # chat_id 찾기
-                chat_id = None
                 if msg_id in notion_map:
                     chat_id = notion_map[msg_id]["chat_id"]
-                elif msg_id in self._msg_chat_ids:
-                    chat_id = self._msg_chat_ids[msg_id]
                 else:
-                    chat_id = message.chat_id  # 기본값
-
-                # 텔레그램 메시지 존재 확인
-                exists = await self._check_message_exists(
-                    context.bot, chat_id, msg_id
-                )
-                telegram_exists[msg_id] = exists
+                    track = self._tracks.get(msg_id)
+                    chat_id = (
+                        track.chat_id
+                        if track is not None and track.chat_id is not None
+                        else message.chat_id  # 기본값
+                    )
 
-                # API 속도 제한 방지
-                await asyncio.sleep(0.05)
+                async with sem:
+                    # 텔레그램 메시지 존재 확인 (봇 공용 속도 제한)
+                    telegram_exists[msg_id] = await self._tg(
+                        self._check_message_exists(
+                            context.bot, chat_id, msg_id
+                        )
+                    )
 
+                checked += 1
                 # 진행 상황 업데이트 (50개마다)
                 if checked % 50 == 0:
-                    await status_msg.edit_text(
-                        f"🔍 매물 확인 중... {checked}/{len(all_msg_ids)}"
-                    )
+                    try:
+                        await status_msg.edit_text(
+                            f"🔍 매물 확인 중... {checked}/{len(all_msg_ids)}"
+                        )
+                    except Exception:
+                        pass
+
+            await asyncio.gather(*[_check_one(m) for m in all_msg_ids])
 
             # ── 4단계: 차이점 분석 ──
             for msg_id in all_msg_ids:
                 exists = telegram_exists.get(msg_id, False)
                 in_notion = msg_id in notion_map
-                in_memory = msg_id in self._page_mapping
+                in_memory = msg_id in self._tracks
 
                 if not exists and in_notion:
                     # 텔레그램에 없는데 노션에 있음 → 노션에만 있음
@@ -4396,7 +4996,7 @@ class TelegramNotionBot:
             # ── 5단계: 결과 메시지 생성 ──
             telegram_count = sum(1 for exists in telegram_exists.values() if exists)
             notion_count = len(notion_map) + len(
-                [m for m in self._page_mapping if m not in notion_map]
+                [m for m in self._tracks if m not in notion_map]
             )
 
             result = "📊 매물 확인 결과\n"
@@ -4455,9 +5055,9 @@ class TelegramNotionBot:
             # 현재 메모리에 있는 텔레그램 매물 (봇 실행 후 등록된 것들)
             telegram_properties = {}  # {주소: 메시지ID}
             
-            for msg_id, page_id in self._page_mapping.items():
-                if msg_id in self._original_texts:
-                    text = self._original_texts[msg_id]
+            for msg_id, track in self._tracks.items():
+                text = track.text
+                if text is not None:
                     lines = text.strip().split("\n")
                     if lines:
                         address = lines[0].strip()
@@ -4477,8 +5077,10 @@ class TelegramNotionBot:
                 if start_cursor:
                     query_params["start_cursor"] = start_cursor
                 
-                response = self.notion_uploader.client.databases.query(
-                    **query_params
+                # 동기 Notion 호출은 스레드에서 실행 (페이지 조회 중에도 이벤트 루프 응답)
+                response = await asyncio.to_thread(
+                    self.notion_uploader.client.databases.query,
+                    **query_params,
                 )
                 
                 for page in response.get("results", []):
@@ -4498,39 +5100,42 @@ class TelegramNotionBot:
             telegram_count = len(telegram_properties)
             notion_count = len(notion_properties)
             
-            telegram_addrs = set(telegram_properties.keys())
-            notion_addrs = set(notion_properties.keys())
-            
-            missing_in_notion = telegram_addrs - notion_addrs
-            missing_in_telegram = notion_addrs - telegram_addrs
+            # 텔레그램 쪽(보통 훨씬 적음)만 한 번 순회하며 노션 dict에 조회
+            missing_in_notion = [
+                addr for addr in telegram_properties
+                if addr not in notion_properties
+            ]
+            synced_count = telegram_count - len(missing_in_notion)
             
             # 결과 메시지 생성
-            result_text = "📊 매물 동기화 체크 결과\n\n"
-            result_text += f"📱 텔레그램 매물 (봇 실행 후): {telegram_count}개\n"
-            result_text += f"📝 노션 매물 (전체): {notion_count}개\n"
+            parts = [
+                "📊 매물 동기화 체크 결과\n\n",
+                f"📱 텔레그램 매물 (봇 실행 후): {telegram_count}개\n",
+                f"📝 노션 매물 (전체): {notion_count}개\n",
+            ]
             
             if missing_in_notion:
-                result_text += f"\n⚠️ 노션에 없는 매물 ({len(missing_in_notion)}개):\n"
-                for addr in sorted(missing_in_notion)[:10]:
-                    result_text += f"  • {addr}\n"
+                parts.append(f"\n⚠️ 노션에 없는 매물 ({len(missing_in_notion)}개):\n")
+                for addr in heapq.nsmallest(10, missing_in_notion):
+                    parts.append(f"  • {addr}\n")
                 if len(missing_in_notion) > 10:
-                    result_text += f"  ... 외 {len(missing_in_notion) - 10}개\n"
+                    parts.append(f"  ... 외 {len(missing_in_notion) - 10}개\n")
             
             if telegram_count > 0:
-                sync_rate = len(telegram_addrs & notion_addrs) / telegram_count * 100
-                result_text += f"\n✅ 동기화율: {sync_rate:.1f}%\n"
+                sync_rate = synced_count / telegram_count * 100
+                parts.append(f"\n✅ 동기화율: {sync_rate:.1f}%\n")
             
             if not missing_in_notion and telegram_count > 0:
-                result_text += "\n✅ 봇 실행 후 등록된 모든 매물이 동기화되어 있습니다!"
+                parts.append("\n✅ 봇 실행 후 등록된 모든 매물이 동기화되어 있습니다!")
             elif telegram_count == 0:
-                result_text += "\n💡 봇 실행 후 등록된 매물이 없습니다.\n"
-                result_text += f"   (노션에는 총 {notion_count}개 매물이 있습니다)"
+                parts.append("\n💡 봇 실행 후 등록된 매물이 없습니다.\n")
+                parts.append(f"   (노션에는 총 {notion_count}개 매물이 있습니다)")
             else:
-                result_text += "\n💡 동기화되지 않은 매물을 확인하세요."
+                parts.append("\n💡 동기화되지 않은 매물을 확인하세요.")
             
-            result_text += "\n\n⚠️ 참고: 봇 실행 전 매물은 표시되지 않습니다."
+            parts.append("\n\n⚠️ 참고: 봇 실행 전 매물은 표시되지 않습니다.")
             
-            await status_msg.edit_text(result_text)
+            await status_msg.edit_text("".join(parts))
             
         except Exception as e:
             logger.error(f"매물 체크 오류: {e}", exc_info=True)
@@ -4562,7 +5167,7 @@ class TelegramNotionBot:
             return
 
         # 답장 대상에서 노션 페이지 ID 추출
-        page_id = self._get_page_id_from_reply(reply)
+        page_id = await self._get_page_id_from_reply(reply)
         if not page_id:
             await message.reply_text(
                 "⚠️ 이 메시지에 연결된 노션 페이지를 찾을 수 없습니다.\n"
@@ -4572,22 +5177,24 @@ class TelegramNotionBot:
 
         try:
             # 노션 페이지 제목 조회 (확인용)
-            page_props = self.notion_uploader.get_page_properties(page_id)
+            page_props = await asyncio.to_thread(
+                self.notion_uploader.get_page_properties, page_id
+            )
             page_title = page_props.get("주소", "매물")
 
             # 노션 페이지 아카이브
-            self.notion_uploader.archive_property(page_id)
+            await asyncio.to_thread(
+                self.notion_uploader.archive_property, page_id
+            )
 
             # 매핑 정보 제거
             reply_id = reply.message_id
-            self._page_mapping.pop(reply_id, None)
-            self._original_texts.pop(reply_id, None)
-            self._msg_chat_ids.pop(reply_id, None)
+            self._tracks.pop(reply_id, None)
 
             # 원본 매물 메시지 삭제 시도
             deleted_msg = False
             try:
-                await reply.delete()
+                await self._tg(reply.delete())
                 deleted_msg = True
             except Exception as e:
                 logger.warning(
@@ -4596,7 +5203,7 @@ class TelegramNotionBot:
 
             # /delete 명령어 메시지도 삭제 시도
             try:
-                await message.delete()
+                await self._tg(message.delete())
             except Exception:
                 pass
 
@@ -4646,11 +5253,14 @@ class TelegramNotionBot:
             floor_photos: 층별 사진 그룹 [{"label": "1층", "photos": [...]}]
                           None이면 구분 없이 flat 표시
         """
+        dup_task = None
         try:
             # 9번 항목이 8번 바로 아래에 오도록 재정렬 (특이사항이 중간에 껴 있어도)
             description = self._reorder_section9(description)
 
-            property_data = self.parser.parse_property_info(description)
+            property_data = await asyncio.to_thread(
+                self.parser.parse_property_info, description
+            )
             property_data["원본 메시지"] = description
             property_data["telegram_chat_id"] = trigger_message.chat_id
             property_data["telegram_msg_id"] = trigger_message.message_id
@@ -4672,6 +5282,15 @@ class TelegramNotionBot:
             address = property_data.get("주소", "")
             cld_folder = _make_cloudinary_folder(address)
 
+            # 동일 주소 중복 검색은 업로드와 동시에 진행
+            # (새 페이지가 결과에 섞일 수 있으므로 1개, 한도 초과 여부
+            #  판별용으로 1개 → 2개 더 받아서 나중에 제외)
+            if address:
+                dup_task = asyncio.create_task(asyncio.to_thread(
+                    self.notion_uploader.find_pages_by_address,
+                    address, limit=self.DUPLICATE_SEARCH_LIMIT + 2,
+                ))
+
             if _CLOUDINARY_ENABLED and photo_urls:
                 photo_urls = await _upload_photos_to_cloudinary(
                     photo_urls, folder=cld_folder
@@ -4684,25 +5303,26 @@ class TelegramNotionBot:
                             grp_photos, folder=cld_folder
                         )
 
-            # 노션 업로드
-            page_url, page_id = self.notion_uploader.upload_property(
+            # 노션 업로드 (페이지 생성 + 사진 블록 append를 스레드에서 실행)
+            page_url, page_id = await self.notion_uploader.create_page(
                 property_data,
                 photo_urls if photo_urls else None,
                 floor_photos=floor_photos,
             )
 
             # 매핑 저장 (설명 메시지)
-            self._page_mapping[trigger_message.message_id] = page_id
-            self._original_texts[trigger_message.message_id] = description
-            self._msg_chat_ids[trigger_message.message_id] = (
-                trigger_message.chat_id
+            self._track_page(
+                trigger_message.message_id, page_id,
+                chat_id=trigger_message.chat_id, text=description,
             )
             # Cloudinary 폴더 저장 (추가사진 업로드 시 동일 폴더 사용)
             self._page_cld_folders[trigger_message.message_id] = cld_folder
             # 첫 사진 메시지 ID도 매핑 저장 (추가사진 답장 시 사진에 답장해도 찾을 수 있게)
             if first_photo_msg and first_photo_msg.message_id != trigger_message.message_id:
-                self._page_mapping[first_photo_msg.message_id] = page_id
-                self._msg_chat_ids[first_photo_msg.message_id] = first_photo_msg.chat_id
+                self._track_page(
+                    first_photo_msg.message_id, page_id,
+                    chat_id=first_photo_msg.chat_id,
+                )
                 self._page_cld_folders[first_photo_msg.message_id] = cld_folder
                 logger.debug(
                     f"첫 사진 메시지 매핑 저장: msg_id={first_photo_msg.message_id} → page_id={page_id}"
@@ -4711,25 +5331,19 @@ class TelegramNotionBot:
             self._save_page_mapping()
 
             # 원본 메시지에 노션 링크 추가
-            notion_html = self._build_notion_section(
-                page_url, page_id, use_html=True,
-            )
-            notion_plain = self._build_notion_section(
-                page_url, page_id, use_html=False,
-            )
             is_caption = trigger_message.caption is not None
             success = await self._safe_edit_message(
                 trigger_message,
                 description,
-                notion_html,
-                notion_plain,
+                page_url,
+                page_id,
                 is_caption=is_caption,
             )
             if not success:
                 try:
-                    await trigger_message.reply_text(
+                    await self._tg(trigger_message.reply_text(
                         f"✅ 노션 등록완료\n🔗 {page_url}"
-                    )
+                    ))
                 except Exception:
                     pass
 
@@ -4739,36 +5353,46 @@ class TelegramNotionBot:
             )
 
             # ── 동일 주소 중복 감지 알림 (방법 A) ──
-            address = property_data.get("주소", "")
-            if address:
-                duplicates = (
-                    self.notion_uploader.find_pages_by_address(
-                        address, exclude_page_id=page_id
-                    )
-                )
+            if dup_task is not None:
+                page_clean = _clean_pid(page_id)
+                duplicates = [
+                    dup for dup in await dup_task
+                    if _clean_pid(dup["page_id"]) != page_clean
+                ]
+                # 새 페이지 제외 후에도 한도를 넘으면 실제 개수는 알 수 없음
+                truncated = len(duplicates) > self.DUPLICATE_SEARCH_LIMIT
+                duplicates = duplicates[:self.DUPLICATE_SEARCH_LIMIT]
                 if duplicates:
-                    dup_msg = (
+                    dup_parts = [
                         f"⚠️ 동일 주소 매물 감지!\n"
                         f"📍 {address}\n\n"
                         f"기존 등록된 매물:\n"
-                    )
+                    ]
                     for dup in duplicates[:3]:
-                        dup_msg += (
+                        dup_parts.append(
                             f"• {dup['title']}\n"
                             f"  🔗 {dup['url']}\n"
                         )
                     if len(duplicates) > 3:
-                        dup_msg += f"... 외 {len(duplicates) - 3}개\n"
-                    dup_msg += (
+                        # 한도를 넘겨 잘린 경우에만 "이상"으로 표시
+                        more = " 이상" if truncated else ""
+                        dup_parts.append(
+                            f"... 외 {len(duplicates) - 3}개{more}\n"
+                        )
+                    dup_parts.append(
                         "\n💡 기존 매물 확인 후 "
                         "필요시 보관처리 해주세요."
                     )
                     try:
-                        await trigger_message.reply_text(dup_msg)
+                        await self._tg(trigger_message.reply_text(
+                            "".join(dup_parts)
+                        ))
                     except Exception:
                         pass
 
         except Exception as e:
+            if dup_task is not None:
+                dup_task.cancel()
             logger.error(f"매물 저장 오류: {e}", exc_info=True)
             error_msg = (
                 f"❌ 매물 저장 실패!\n"
@@ -4779,7 +5403,7 @@ class TelegramNotionBot:
             )
             for retry_i in range(3):
                 try:
-                    await trigger_message.reply_text(error_msg)
+                    await self._tg(trigger_message.reply_text(error_msg))
                     break
                 except Exception as notify_err:
                     logger.error(
@@ -4796,15 +5420,18 @@ class TelegramNotionBot:
     async def handle_photo_message(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
-        """사진 메시지 처리 (그룹/채널 + 앨범/단일 사진)"""
+        """사진 메시지 처리 (그룹/채널 + 앨범/단일 사진) - 채팅별 순차 실행"""
+        async with self._chat_locks[update.effective_chat.id]:
+            await self._process_photo_message(update, context)
+
+    async def _process_photo_message(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE
+    ):
+        """사진 메시지 처리 본체 (handle_photo_message에서 채팅 잠금 후 호출)"""
         message = update.effective_message
         if not message:
             return
 
-        # 동기화 중 전달된 메시지 무시
-        if self._sync_in_progress and message.forward_origin:
-            return
-
         media_group_id = message.media_group_id
 
         if media_group_id:
@@ -4816,9 +5443,7 @@ class TelegramNotionBot:
 
             # 사진 URL 가져오기
             try:
-                photo = message.photo[-1]
-                photo_file = await photo.get_file()
-                photo_url = photo_file.file_path
+                photo_url = await self._get_file_path(message.photo[-1])
             except Exception as e:
                 logger.error(f"사진 URL 가져오기 실패: {e}")
                 return
@@ -4846,65 +5471,71 @@ class TelegramNotionBot:
                 )
             # 캡션 없거나 매물 형식 아니면 → 사진만 버퍼에 보관
 
+    async def _get_file_path(self, photo) -> str:
+        """사진 file_id → 다운로드 URL (file_path), 세션 내 캐시 사용"""
+        now = time.monotonic()
+        cached = self._file_path_cache.get(photo.file_id)
+        if cached is not None and now - cached[1] < self.FILE_PATH_TTL:
+            return cached[0]
+        photo_file = await photo.get_file()
+        self._file_path_cache[photo.file_id] = (photo_file.file_path, now)
+        return photo_file.file_path
+
     async def _collect_media_group(self, message, context):
         """앨범 사진을 수집하고, 타임아웃 후 일괄 처리"""
         media_group_id = message.media_group_id
 
         # 첫 번째 사진이면 그룹 초기화
-        if media_group_id not in self._media_groups:
-            self._media_groups[media_group_id] = {
-                "photos": [],
-                "caption": None,
-                "message": message,
-                "author_signature": message.author_signature,
-                "context": context,  # 30초 저장 버퍼에서 사용
-                "reply_to_message": message.reply_to_message,  # 답장 대상 메시지
-            }
+        group = self._media_groups.get(media_group_id)
+        if group is None:
+            group = self._media_groups[media_group_id] = _MediaGroup(
+                message=message,
+                context=context,
+                author_signature=message.author_signature,
+                reply_to_message=message.reply_to_message,
+            )
 
         # 사진 추가 (가장 큰 해상도)
-        photo = message.photo[-1]
-        photo_file = await photo.get_file()
-        self._media_groups[media_group_id]["photos"].append(
-            photo_file.file_path
-        )
+        photo_url = await self._get_file_path(message.photo[-1])
+        group.photos.append(photo_url)
 
         # 캡션이 있으면 저장
         if message.caption:
-            self._media_groups[media_group_id]["caption"] = (
-                message.caption
-            )
-            self._media_groups[media_group_id]["message"] = message
+            group.caption = message.caption
+            group.message = message
 
         # 기존 타이머가 있으면 취소
         task_key = f"media_group_{media_group_id}"
-        if task_key in self._pending_tasks:
-            self._pending_tasks[task_key].cancel()
+        prev_timer = self._media_group_timers.pop(task_key, None)
+        if prev_timer:
+            prev_timer.cancel()
 
         # 새 타이머 설정 (2초 후 처리)
-        self._pending_tasks[task_key] = asyncio.create_task(
-            self._delayed_process_media_group(media_group_id)
+        self._media_group_timers[task_key] = asyncio.get_running_loop().call_later(
+            self.MEDIA_GROUP_TIMEOUT,
+            self._start_media_group_processing,
+            media_group_id,
         )
 
-    async def _delayed_process_media_group(self, media_group_id):
-        """일정 시간 대기 후 미디어 그룹 처리"""
-        await asyncio.sleep(self.MEDIA_GROUP_TIMEOUT)
-        await self._process_media_group(media_group_id)
+    def _start_media_group_processing(self, media_group_id):
+        """앨범 수집 타이머 만료 → 미디어 그룹 처리 태스크 시작"""
+        self._spawn(self._process_media_group(media_group_id))
 
     async def _process_media_group(self, media_group_id):
         """수집된 앨범 사진을 채팅 버퍼에 추가하고, 캡션이 매물 설명이면 저장 예약"""
         task_key = f"media_group_{media_group_id}"
-        self._pending_tasks.pop(task_key, None)
+        self._media_group_timers.pop(task_key, None)
 
         group_data = self._media_groups.pop(media_group_id, None)
         if not group_data:
             return
 
-        message = group_data["message"]
-        caption = group_data["caption"]
-        photo_urls = group_data["photos"]
-        context = group_data.get("context")
-        author_sig = group_data.get("author_signature")
-        reply_to = group_data.get("reply_to_message")
+        message = group_data.message
+        caption = group_data.caption
+        photo_urls = group_data.photos
+        context = group_data.context
+        author_sig = group_data.author_signature
+        reply_to = group_data.reply_to_message
         chat_id = message.chat_id
 
         logger.debug(
@@ -4935,14 +5566,8 @@ class TelegramNotionBot:
                 active_buf = self._find_active_extra_buffer(chat_id)
                 if active_buf is not None:
                     orig_msg_id_found, buf_data = active_buf
-                    buf_data["photos"].extend(photo_urls)
-                    if buf_data.get("timer_task"):
-                        buf_data["timer_task"].cancel()
-                    buf_data["timer_task"] = asyncio.create_task(
-                        self._do_save_extra_photos(
-                            orig_msg_id_found, context.bot
-                        )
-                    )
+                    buf_data.photos.extend(photo_urls)
+                    self._reset_extra_photo_timer(orig_msg_id_found, context.bot)
                     logger.info(
                         f"추가사진(reply없음) → 활성 버퍼 합류: "
                         f"orig={orig_msg_id_found}, {len(photo_urls)}장"
@@ -4978,12 +5603,8 @@ class TelegramNotionBot:
             active_buf = self._find_active_extra_buffer(chat_id)
             if active_buf is not None:
                 orig_msg_id, buf_data = active_buf
-                buf_data["photos"].extend(photo_urls)
-                if buf_data.get("timer_task"):
-                    buf_data["timer_task"].cancel()
-                buf_data["timer_task"] = asyncio.create_task(
-                    self._do_save_extra_photos(orig_msg_id, context.bot)
-                )
+                buf_data.photos.extend(photo_urls)
+                self._reset_extra_photo_timer(orig_msg_id, context.bot)
                 logger.info(
                     f"추가사진 2차 앨범 자동 연결: chat={chat_id}, "
                     f"{len(photo_urls)}장 → orig_msg={orig_msg_id}"
@@ -5024,29 +5645,43 @@ class TelegramNotionBot:
                 message_id=message_id,
             )
             return True
+        except BadRequest as e:
+            known = _PROBE_BADREQUEST_RESULTS.get(e.message)
+            if known is not None:
+                return known
+            return TelegramNotionBot._classify_probe_error(
+                e, chat_id, message_id
+            )
         except Exception as e:
-            err = str(e).lower()
-            if "there is no reply_markup" in err:
-                return True
-            if "not modified" in err:
-                return True
-            if "message can't be edited" in err:
-                return True
-            if "chat not found" in err:
-                logger.warning(
-                    f"채팅 접근 불가 (삭제 아님으로 처리) "
-                    f"(chat={chat_id}, msg={message_id}): {e}"
-                )
-                return True
-            if "message" in err and "not found" in err:
-                return False
-            if "message_id_invalid" in err:
-                return False
+            return TelegramNotionBot._classify_probe_error(
+                e, chat_id, message_id
+            )
+
+    @staticmethod
+    def _classify_probe_error(e: Exception, chat_id: int, message_id: int) -> bool:
+        """_check_message_exists 예외를 메시지 문자열로 판별 (알 수 없는 형태용)"""
+        err = str(e).lower()
+        if "there is no reply_markup" in err:
+            return True
+        if "not modified" in err:
+            return True
+        if "message can't be edited" in err:
+            return True
+        if "chat not found" in err:
             logger.warning(
-                f"메시지 존재 확인 불확실 "
+                f"채팅 접근 불가 (삭제 아님으로 처리) "
                 f"(chat={chat_id}, msg={message_id}): {e}"
             )
             return True
+        if "message" in err and "not found" in err:
+            return False
+        if "message_id_invalid" in err:
+            return False
+        logger.warning(
+            f"메시지 존재 확인 불확실 "
+            f"(chat={chat_id}, msg={message_id}): {e}"
+        )
+        return True
 
     async def _sync_deleted_properties(
         self, bot, report_chat_id: int = None
@@ -5062,7 +5697,6 @@ class TelegramNotionBot:
              "archived_titles": List[str],
              "notion_count": int, "memory_count": int}
         """
-        self._sync_in_progress = True
         result = {
             "checked": 0,
             "archived": 0,
@@ -5072,9 +5706,9 @@ class TelegramNotionBot:
         }
 
         try:
-            # ── 1단계: 노션 DB에서 추적 중인 페이지 조회 ──
-            tracked_pages = (
-                self.notion_uploader.get_tracked_pages()
+            # ── 1단계: 노션 DB에서 추적 중인 페이지 조회 (스냅샷 + 변경분) ──
+            tracked_pages = await asyncio.to_thread(
+                self.notion_uploader.get_tracked_pages_snapshot
             )
             result["notion_count"] = len(tracked_pages)
             notion_msg_ids = {
@@ -5082,12 +5716,11 @@ class TelegramNotionBot:
             }
 
             # ── 2단계: 메모리 매핑도 추가 (중복 제거) ──
-            for msg_id, page_id in list(
-                self._page_mapping.items()
-            ):
+            for msg_id, track in list(self._tracks.items()):
                 if msg_id in notion_msg_ids:
                     continue  # 노션에 이미 있으면 스킵
-                chat_id = self._msg_chat_ids.get(msg_id)
+                page_id = track.page_id
+                chat_id = track.chat_id
                 if not chat_id and report_chat_id:
                     chat_id = report_chat_id
                 if chat_id:
@@ -5108,24 +5741,24 @@ class TelegramNotionBot:
             )
 
             # 1차 패스: 삭제 대상 후보만 수집 (아직 실제 삭제 안 함)
-            delete_candidates = []
-            for page_info in tracked_pages:
-                page_id = page_info["page_id"]
-                chat_id = page_info["chat_id"]
-                msg_id = page_info["msg_id"]
-                title = page_info["title"] or "제목 없음"
+            # 동시 요청 수는 세마포어, 전체 속도는 봇 공용 토큰 버킷으로 제한
+            sem = asyncio.Semaphore(self.SYNC_PROBE_CONCURRENCY)
 
-                result["checked"] += 1
+            async def _probe(page_info: Dict) -> bool:
+                async with sem:
+                    return await self._tg(self._check_message_exists(
+                        bot, page_info["chat_id"], page_info["msg_id"]
+                    ))
 
-                exists = await self._check_message_exists(
-                    bot, chat_id, msg_id
-                )
-
-                if not exists:
-                    delete_candidates.append(page_info)
-
-                # API 속도 제한 방지 (0.5초 간격)
-                await asyncio.sleep(0.5)
+            exists_list = await asyncio.gather(
+                *[_probe(p) for p in tracked_pages]
+            )
+            result["checked"] = len(tracked_pages)
+            delete_candidates = [
+                page_info
+                for page_info, exists in zip(tracked_pages, exists_list)
+                if not exists
+            ]
 
             # ── 대량 삭제 안전장치 ──
             # 전체 매물의 30% 초과 삭제 시 오동작으로 간주하고 중단
@@ -5149,29 +5782,38 @@ class TelegramNotionBot:
                 )
                 return result
 
-            # 2차 패스: 실제 아카이브 처리
-            for page_info in delete_candidates:
-                page_id = page_info["page_id"]
-                msg_id = page_info["msg_id"]
-                title = page_info["title"] or "제목 없음"
-                try:
-                    self.notion_uploader.archive_property(page_id)
-                    result["archived"] += 1
-                    result["archived_titles"].append(title)
-
-                    self._page_mapping.pop(msg_id, None)
-                    self._original_texts.pop(msg_id, None)
-                    self._msg_chat_ids.pop(msg_id, None)
+            # 2차 패스: 실제 아카이브 처리 (스레드에서 병렬, 동시 요청 수 제한)
+            archive_sem = asyncio.Semaphore(self.SYNC_ARCHIVE_CONCURRENCY)
 
-                    logger.info(
-                        f"동기화 삭제: '{title}' "
-                        f"(msg_id={msg_id})"
+            async def _archive(page_info: Dict):
+                async with archive_sem:
+                    return await asyncio.to_thread(
+                        self.notion_uploader.archive_property,
+                        page_info["page_id"],
                     )
-                except Exception as e:
+
+            outcomes = await asyncio.gather(
+                *[_archive(p) for p in delete_candidates],
+                return_exceptions=True,
+            )
+            for page_info, outcome in zip(delete_candidates, outcomes):
+                msg_id = page_info["msg_id"]
+                title = page_info["title"] or "제목 없음"
+                if isinstance(outcome, BaseException):
                     logger.error(
                         f"동기화 아카이브 실패 "
-                        f"'{title}': {e}"
+                        f"'{title}': {outcome}"
                     )
+                    continue
+                result["archived"] += 1
+                result["archived_titles"].append(title)
+
+                self._tracks.pop(msg_id, None)
+
+                logger.info(
+                    f"동기화 삭제: '{title}' "
+                    f"(msg_id={msg_id})"
+                )
 
             logger.info(
                 f"동기화 완료: {result['checked']}개 확인, "
@@ -5180,8 +5822,6 @@ class TelegramNotionBot:
 
         except Exception as e:
             logger.error(f"동기화 처리 오류: {e}", exc_info=True)
-        finally:
-            self._sync_in_progress = False
 
         return result
 
@@ -5197,7 +5837,7 @@ class TelegramNotionBot:
             f"/동기화 명령어 수신 (chat_id={message.chat_id})"
         )
 
-        mem_count = len(self._page_mapping)
+        mem_count = len(self._tracks)
         status_msg = await message.reply_text(
             "🔄 동기화 시작...\n"
             f"메모리 추적 매물: {mem_count}개\n"
@@ -5224,7 +5864,7 @@ class TelegramNotionBot:
                 return
 
             # 결과 메시지 생성
-            report = (
+            report_parts = [
                 f"✅ 동기화 완료!\n\n"
                 f"📊 확인한 매물: {result['checked']}개\n"
                 f"  • 노션 DB 추적: "
@@ -5233,31 +5873,31 @@ class TelegramNotionBot:
                 f"{result['memory_count']}개\n"
                 f"🗑️ 삭제(아카이브): "
                 f"{result['archived']}개\n"
-            )
+            ]
 
             if result["archived_titles"]:
-                report += "\n삭제된 매물:\n"
+                report_parts.append("\n삭제된 매물:\n")
                 for title in result["archived_titles"][:20]:
-                    report += f"  • {title}\n"
+                    report_parts.append(f"  • {title}\n")
                 if len(result["archived_titles"]) > 20:
                     extra = (
                         len(result["archived_titles"]) - 20
                     )
-                    report += f"  ... 외 {extra}개\n"
+                    report_parts.append(f"  ... 외 {extra}개\n")
 
             if result["checked"] == 0:
-                report += (
+                report_parts.append(
                     "\n⚠️ 추적 중인 매물이 없습니다.\n"
                     "이 코드 업데이트 이후 새로 등록된 "
                     "매물부터 동기화가 가능합니다."
                 )
             elif result["archived"] == 0:
-                report += (
+                report_parts.append(
                     "\n💡 텔레그램에서 삭제된 매물이 없습니다. "
                     "모든 매물이 정상입니다!"
                 )
 
-            await status_msg.edit_text(report)
+            await status_msg.edit_text("".join(report_parts))
 
         except Exception as e:
             logger.error(
@@ -5270,13 +5910,25 @@ class TelegramNotionBot:
     async def _post_init(self, application):
         """봇 초기화 후 백그라운드 태스크 시작"""
         self._app = application
+        # 동기화용 Notion 속성 초기화 (네트워크 호출 → 생성자가 아닌 시작 시점에 1회)
+        # post_init은 폴링 시작 전에 끝까지 실행되므로 첫 업데이트보다 먼저 완료됨
+        await asyncio.to_thread(self.notion_uploader.ensure_sync_properties)
         # 자동 동기화 비활성화 (오동작으로 인한 대량 삭제 방지)
         # 삭제가 필요한 경우 /delete 또는 /동기화 명령어를 직접 사용하세요.
-        asyncio.create_task(
-            self._recover_features_on_startup()
-        )
+        self._spawn(self._recover_features_on_startup())
+        self._spawn(self._build_msg_index_on_startup())
         logger.info("자동 동기화 비활성화됨 (수동 /동기화 명령어 사용)")
 
+    async def _build_msg_index_on_startup(self):
+        """봇 시작 시 msg_id → page_id 역인덱스 일괄 구성 (이후 조회는 메모리에서)"""
+        try:
+            count = await asyncio.to_thread(
+                self.notion_uploader.build_msg_index
+            )
+            logger.info(f"msg_id 역인덱스 구성 완료: {count}개")
+        except Exception as e:
+            logger.warning(f"msg_id 역인덱스 구성 실패 (개별 조회 사용): {e}")
+
     async def _recover_features_on_startup(self):
         """봇 시작 시 상가 특징이 비어있는 매물을 원본 메시지에서 복구"""
         # 초기화 안정화 대기
@@ -5287,8 +5939,8 @@ class TelegramNotionBot:
 
         try:
             # 1. 상가 특징이 비어있는 페이지 목록 조회
-            pages = (
-                self.notion_uploader.get_pages_missing_features()
+            pages = await asyncio.to_thread(
+                self.notion_uploader.get_pages_missing_features
             )
             if not pages:
                 logger.info(
@@ -5321,10 +5973,8 @@ class TelegramNotionBot:
                     reordered = self._reorder_section9(
                         original_text
                     )
-                    parsed = (
-                        self.parser.parse_property_info(
-                            reordered
-                        )
+                    parsed = await asyncio.to_thread(
+                        self.parser.parse_property_info, reordered
                     )
                     features = parsed.get("상가_특징")
 
@@ -5341,7 +5991,8 @@ class TelegramNotionBot:
                             ]
                         }
                     }
-                    self.notion_uploader.update_page_raw_properties(
+                    await asyncio.to_thread(
+                        self.notion_uploader.update_page_raw_properties,
                         page_id, update_props,
                     )
                     recovered += 1
@@ -5416,7 +6067,7 @@ class TelegramNotionBot:
         content = msg.text or msg.caption or ""
         if not content:
             return None
-        first_line = content.strip().split("\n")[0].strip()
+        first_line = content.strip().partition("\n")[0].strip()
         # 너무 짧거나 숫자만 있으면 주소가 아님
         if len(first_line) < 4:
             return None
@@ -5435,19 +6086,42 @@ class TelegramNotionBot:
             - is_extra: True면 추가사진 답장
             - label: "추가사진" 또는 "추가사진 (철거)" 등
         """
-        if not caption:
+        # 대부분의 캡션은 '추'·'사'가 없음 → 정규식 없이 바로 제외
+        # ("추 가 사 진"처럼 글자 사이 공백도 허용하므로 글자 단위로 확인)
+        if not caption or "추" not in caption or "사" not in caption:
             return False, ""
         # 공백 제거 후 키워드 체크
-        normalized = re.sub(r"\s+", "", caption)
+        normalized = _WS_RE.sub("", caption)
         if "추가" in normalized and "사진" in normalized:
             # '추가', '사진' 제거 후 남은 키워드 → 부가 라벨
-            extra_kw = re.sub(r"[추가사진]", "", caption)
-            extra_kw = re.sub(r"\s+", " ", extra_kw).strip()
+            extra_kw = caption.translate(_EXTRA_STRIP)
+            extra_kw = _WS_RE.sub(" ", extra_kw).strip()
             label = f"추가사진 ({extra_kw})" if extra_kw else "추가사진"
             return True, label
         return False, ""
 
-    def _get_extra_photo_page_id(
+    async def _refind_page_id(
+        self, msg_id: int, failed_page_id: str
+    ) -> Optional[str]:
+        """노션 호출 실패 후 telegram_msg_id로 페이지 재조회
+
+        실패 원인이 아카이브면 역인덱스에서 빠져 있으므로 DB 쿼리가 다시
+        실행됨. 다른 페이지를 찾은 경우에만 매핑을 갱신해 반환 (아니면 None).
+        """
+        page_id = await asyncio.to_thread(
+            self.notion_uploader.find_page_by_msg_id, msg_id
+        )
+        if not page_id or _clean_pid(page_id) == _clean_pid(failed_page_id):
+            return None
+        self._track_page(msg_id, page_id)
+        self._save_page_mapping()
+        logger.info(
+            f"노션 페이지 재조회로 대상 변경: msg_id={msg_id}, "
+            f"{failed_page_id} → {page_id}"
+        )
+        return page_id
+
+    async def _get_extra_photo_page_id(
         self,
         orig_msg_id: int,
         reply_message=None,
@@ -5455,24 +6129,27 @@ class TelegramNotionBot:
         """원본 메시지 ID → 노션 페이지 ID 조회
 
         탐색 순서:
-          1. 메모리 매핑 (_page_mapping)
+          1. 메모리 매핑 (_tracks)
           2. 원본 메시지 텍스트에 포함된 Notion URL 파싱
           3. 노션 DB에서 telegram_msg_id로 검색
         """
         # 1. 메모리 매핑
-        if orig_msg_id in self._page_mapping:
-            return self._page_mapping[orig_msg_id]
+        page_id = self._page_id_of(orig_msg_id)
+        if page_id is not None:
+            return page_id
 
         # 2. 원본 메시지에 첨부된 Notion URL 파싱 (봇 재시작 후에도 동작)
         if reply_message:
-            page_id = self._get_page_id_from_reply(reply_message)
+            page_id = await self._get_page_id_from_reply(reply_message)
             if page_id:
                 # 매핑에 캐싱해 두어 다음 호출 빠르게
-                self._page_mapping[orig_msg_id] = page_id
+                self._track_page(orig_msg_id, page_id)
                 return page_id
 
         # 3. 노션 DB 검색 (telegram_msg_id 속성으로)
-        return self.notion_uploader.find_page_by_msg_id(orig_msg_id)
+        return await asyncio.to_thread(
+            self.notion_uploader.find_page_by_msg_id, orig_msg_id
+        )
 
     async def _handle_extra_photo_reply(
         self,
@@ -5513,12 +6190,8 @@ class TelegramNotionBot:
             chat_active = self._find_active_extra_buffer(message.chat_id)
             if chat_active is not None:
                 active_orig_id, buf_data = chat_active
-                buf_data["photos"].extend(photo_urls)
-                if buf_data.get("timer_task"):
-                    buf_data["timer_task"].cancel()
-                buf_data["timer_task"] = asyncio.create_task(
-                    self._do_save_extra_photos(active_orig_id, context.bot)
-                )
+                buf_data.photos.extend(photo_urls)
+                self._reset_extra_photo_timer(active_orig_id, context.bot)
                 logger.info(
                     f"추가사진 타이밍 보완: chat 활성버퍼({active_orig_id})에 "
                     f"{len(photo_urls)}장 추가"
@@ -5527,7 +6200,9 @@ class TelegramNotionBot:
             # 추가사진 캡션도 없고 기존 버퍼도 없음 → 무시
             return False
 
-        page_id = self._get_extra_photo_page_id(orig_msg_id, reply_message=reply)
+        page_id = await self._get_extra_photo_page_id(
+            orig_msg_id, reply_message=reply
+        )
         if not page_id:
             logger.warning(
                 f"추가사진: 원본 메시지({orig_msg_id})의 노션 페이지를 찾을 수 없음"
@@ -5543,12 +6218,12 @@ class TelegramNotionBot:
                 pass
             return False
 
+        existing_buf = self._extra_photo_buffers.get(orig_msg_id)
         label = (
             extra_label
             if is_extra
-            else self._extra_photo_buffers.get(
-                orig_msg_id, {}
-            ).get("label", "추가사진")
+            else existing_buf.label if existing_buf is not None
+            else "추가사진"
         )
 
         is_new_buffer = orig_msg_id not in self._extra_photo_buffers
@@ -5564,7 +6239,9 @@ class TelegramNotionBot:
         # 첫 추가사진 인식 시 → 메시지에 주소 추가
         # (사진 캡션이든 텍스트든 주소를 앞에 붙여줌)
         if is_new_buffer and is_extra:
-            address = self.notion_uploader.get_page_address(page_id)
+            address = await asyncio.to_thread(
+                self.notion_uploader.get_page_address, page_id
+            )
             if not address:
                 address = self._get_address_from_message(reply)
             if address:
@@ -5605,7 +6282,7 @@ class TelegramNotionBot:
             (orig_msg_id, buf_data) 튜플 또는 None
         """
         for orig_msg_id, buf_data in self._extra_photo_buffers.items():
-            if buf_data.get("chat_id") == chat_id:
+            if buf_data.chat_id == chat_id:
                 return orig_msg_id, buf_data
         return None
 
@@ -5619,25 +6296,25 @@ class TelegramNotionBot:
         chat_id: int = None,
     ):
         """추가사진 버퍼에 사진 추가 + 30초 타이머 리셋"""
-        if orig_msg_id not in self._extra_photo_buffers:
-            self._extra_photo_buffers[orig_msg_id] = {
-                "photos": [],
-                "label": label,
-                "page_id": page_id,
-                "chat_id": chat_id,        # 두 번째 앨범 연결용
-                "timer_task": None,
-                "cld_folder": self._page_cld_folders.get(orig_msg_id, "real_estate"),
-            }
+        buf = self._extra_photo_buffers.get(orig_msg_id)
+        if buf is None:
+            buf = self._extra_photo_buffers[orig_msg_id] = _ExtraPhotoBuf(
+                page_id=page_id,
+                label=label,
+                chat_id=chat_id,
+                cld_folder=self._page_cld_folders.get(
+                    orig_msg_id, "real_estate"
+                ),
+            )
 
-        buf = self._extra_photo_buffers[orig_msg_id]
-        buf["photos"].extend(photos)
+        buf.photos.extend(photos)
         if label:
-            buf["label"] = label  # 새 라벨로 업데이트
+            buf.label = label  # 새 라벨로 업데이트
 
         # 대기목록에 있던 사진들 합류 (2번째 앨범이 먼저 도착한 경우)
         pending = self._pending_reply_photos.pop(orig_msg_id, [])
         if pending:
-            buf["photos"].extend(pending)
+            buf.photos.extend(pending)
             logger.info(
                 f"추가사진 대기목록 합류: orig_msg={orig_msg_id}, "
                 f"{len(pending)}장 추가"
@@ -5645,27 +6322,38 @@ class TelegramNotionBot:
 
         # 사진이 있을 때만 30초 타이머 시작/리셋
         # (텍스트 "추가사진"만 먼저 오면 사진 도착 전 버퍼 사라지는 것 방지)
-        if buf["photos"]:
-            if buf.get("timer_task"):
-                buf["timer_task"].cancel()
-            buf["timer_task"] = asyncio.create_task(
-                self._do_save_extra_photos(orig_msg_id, bot)
-            )
+        if buf.photos:
+            self._reset_extra_photo_timer(orig_msg_id, bot)
+
+    def _reset_extra_photo_timer(self, orig_msg_id: int, bot):
+        """추가사진 저장 타이머 (재)설정 - call_later 핸들만 교체"""
+        buf = self._extra_photo_buffers.get(orig_msg_id)
+        if buf is None:
+            return
+        if buf.timer:
+            buf.timer.cancel()
+        buf.timer = asyncio.get_running_loop().call_later(
+            self.PROPERTY_SAVE_BUFFER,
+            self._start_extra_photo_save,
+            orig_msg_id, bot,
+        )
+
+    def _start_extra_photo_save(self, orig_msg_id: int, bot):
+        """추가사진 저장 타이머 만료 → 저장 태스크 시작"""
+        self._spawn(self._do_save_extra_photos(orig_msg_id, bot))
 
     async def _do_save_extra_photos(
         self, orig_msg_id: int, bot
     ):
-        """30초 대기 후 추가사진을 노션 페이지에 저장"""
-        await asyncio.sleep(self.PROPERTY_SAVE_BUFFER)
-
+        """(30초 대기 후) 추가사진을 노션 페이지에 저장"""
         buf = self._extra_photo_buffers.pop(orig_msg_id, None)
         if not buf:
             return
 
-        photos = buf.get("photos", [])
-        label = buf.get("label", "추가사진")
-        page_id = buf.get("page_id")
-        cld_folder = buf.get("cld_folder", "real_estate")
+        photos = buf.photos
+        label = buf.label
+        page_id = buf.page_id
+        cld_folder = buf.cld_folder
 
         if not photos or not page_id:
             return
@@ -5676,7 +6364,7 @@ class TelegramNotionBot:
                 photos, folder=cld_folder
             )
 
-        date_str = datetime.now().strftime("%y.%m.%d")
+        date_str = time.strftime("%y.%m.%d")
         full_label = f"{label} {date_str}"
 
         # 노션 블록: 구분선 + 헤딩 + 사진
@@ -5696,9 +6384,18 @@ class TelegramNotionBot:
             self.notion_uploader._build_photo_blocks(photos)
         )
 
-        success = self.notion_uploader.append_blocks_to_page(
-            page_id, blocks
+        success = await asyncio.to_thread(
+            self.notion_uploader.append_blocks_to_page, page_id, blocks
         )
+        if not success:
+            # 아카이브된 페이지였다면 DB 재조회로 살아 있는 페이지에 재시도
+            retry_page_id = await self._refind_page_id(orig_msg_id, page_id)
+            if retry_page_id:
+                page_id = retry_page_id
+                success = await asyncio.to_thread(
+                    self.notion_uploader.append_blocks_to_page,
+                    page_id, blocks,
+                )
         if success:
             logger.info(
                 f"추가사진 저장 완료: page_id={page_id}, "
@@ -5710,15 +6407,18 @@ class TelegramNotionBot:
     async def handle_text_message(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
-        """텍스트 전용 메시지 처리 (그룹/채널)"""
+        """텍스트 전용 메시지 처리 (그룹/채널) - 채팅별 순차 실행"""
+        async with self._chat_locks[update.effective_chat.id]:
+            await self._process_text_message(update, context)
+
+    async def _process_text_message(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE
+    ):
+        """텍스트 메시지 처리 본체 (handle_text_message에서 채팅 잠금 후 호출)"""
         message = update.effective_message
         if not message:
             return
 
-        # 동기화 중 전달된 메시지 무시
-        if self._sync_in_progress and message.forward_origin:
-            return
-
         text = message.text or message.caption
         if not text:
             return
@@ -5737,7 +6437,7 @@ class TelegramNotionBot:
             is_extra, extra_label = self._is_extra_photo_caption(text)
             if is_extra:
                 orig_msg_id = message.reply_to_message.message_id
-                page_id = self._get_extra_photo_page_id(
+                page_id = await self._get_extra_photo_page_id(
                     orig_msg_id,
                     reply_message=message.reply_to_message,
                 )
@@ -5751,7 +6451,9 @@ class TelegramNotionBot:
                     # "추가사진" → "수성구 황금동 111-21 대대대 추가사진"
                     # → 채널에서 주소 검색 시 추가사진도 함께 검색됨
                     # 노션에서 주소 가져오기 (가장 확실한 방법)
-                    address = self.notion_uploader.get_page_address(page_id)
+                    address = await asyncio.to_thread(
+                        self.notion_uploader.get_page_address, page_id
+                    )
                     # 노션에서 못 가져오면 reply 메시지에서 추출 시도
                     if not address:
                         address = self._get_address_from_message(
@@ -5800,15 +6502,17 @@ class TelegramNotionBot:
 
         # ── 층수 라벨인지 확인 (30자 이하 짧은 텍스트) ──
         # 채팅 버퍼에 사진이 있을 때만 층수 라벨로 처리
-        text_stripped = text.strip()
+        # 긴 텍스트는 양끝이 공백일 때만 strip (그 외엔 30자 이하가 될 수 없음)
+        if len(text) <= 30 or text[0].isspace() or text[-1].isspace():
+            text_stripped = text.strip()
+        else:
+            text_stripped = text
         if (
             len(text_stripped) <= 30
-            and not text_stripped.startswith("/")
+            and text_stripped[:1] != "/"
         ):
             # 층수 패턴 감지: "1층", "2층", "B1층", "지하층", "1,2층" 등
-            floor_match = re.search(
-                r'([B지하]?\d*(?:[,~\-]\d+)*층)', text_stripped
-            )
+            floor_match = _FLOOR_RE.search(text_stripped)
 
             if message.chat_id in self._chat_buffers:
                 if floor_match:
@@ -5828,12 +6532,7 @@ class TelegramNotionBot:
                     )
 
                 # 버퍼 만료 타이머 리셋 (2분 연장)
-                existing = self._collect_tasks.get(message.chat_id)
-                if existing:
-                    existing.cancel()
-                self._collect_tasks[message.chat_id] = asyncio.create_task(
-                    self._expire_chat_buffer(message.chat_id)
-                )
+                self._reset_collect_timer(message.chat_id)
 
     # ──────────────────────────────────────────────
     # 봇 실행
@@ -5852,79 +6551,36 @@ class TelegramNotionBot:
             Application.builder()
             .token(self.telegram_token)
             .post_init(self._post_init)
+            # 동시 처리 중 연결 풀이 잠시 가득 차도 바로 실패하지 않도록 대기
+            .pool_timeout(self.HTTP_POOL_TIMEOUT)
+            .connect_timeout(self.HTTP_CONNECT_TIMEOUT)
+            .http_version("2" if _HTTP2_AVAILABLE else "1.1")
             .build()
         )
 
-        # 명령어 핸들러 (일반 메시지)
-        application.add_handler(
-            CommandHandler("start", self.start_command)
-        )
-        application.add_handler(
-            CommandHandler("help", self.help_command)
-        )
-        application.add_handler(
-            CommandHandler("check", self.check_command)
-        )
-        application.add_handler(
-            CommandHandler("delete", self.delete_command)
-        )
-        # 한글 명령어는 Regex로 처리
-        application.add_handler(
-            MessageHandler(
-                filters.Regex(r"^/동기화")
-                & (
-                    filters.UpdateType.MESSAGE
-                    | filters.UpdateType.CHANNEL_POST
-                ),
-                self.sync_command,
-            )
-        )
-        application.add_handler(
-            MessageHandler(
-                filters.Regex(r"^/매물확인")
-                & (
-                    filters.UpdateType.MESSAGE
-                    | filters.UpdateType.CHANNEL_POST
-                ),
-                self.property_check_command,
-            )
+        # 새 메시지 (그룹 일반 메시지 + 채널 포스트) - 핸들러 간 공유 필터
+        new_posts = (
+            filters.UpdateType.MESSAGE | filters.UpdateType.CHANNEL_POST
         )
 
-        # 명령어 핸들러 (채널 포스트)
-        application.add_handler(
-            MessageHandler(
-                filters.Regex(r"^/start")
-                & filters.UpdateType.CHANNEL_POST,
-                self.start_command,
-            )
-        )
-        application.add_handler(
-            MessageHandler(
-                filters.Regex(r"^/help")
-                & filters.UpdateType.CHANNEL_POST,
-                self.help_command,
-            )
-        )
-        application.add_handler(
-            MessageHandler(
-                filters.Regex(r"^/check")
-                & filters.UpdateType.CHANNEL_POST,
-                self.check_command,
-            )
-        )
-        application.add_handler(
-            MessageHandler(
-                filters.Regex(r"^/delete")
-                & filters.UpdateType.CHANNEL_POST,
-                self.delete_command,
+        # 영문 명령어 (bot_command 엔티티 기반)
+        for command, callback in (
+            ("start", self.start_command),
+            ("help", self.help_command),
+            ("check", self.check_command),
+            ("delete", self.delete_command),
+        ):
+            application.add_handler(
+                CommandHandler(command, callback, filters=new_posts)
             )
-        )
+
+        # 한글 명령어 - 사진/텍스트 핸들러보다 먼저 확인
         application.add_handler(
             MessageHandler(
-                filters.Regex(r"^/매물확인")
-                & filters.UpdateType.CHANNEL_POST,
-                self.property_check_command,
-            )
+                filters.TEXT & new_posts,
+                self._dispatch_command,
+            ),
+            group=-1,
         )
 
         # 상가 특징 인라인 키보드 콜백
@@ -5945,11 +6601,10 @@ class TelegramNotionBot:
 
         # 채널/그룹 메시지 수정 감지
         # 별도 그룹(group=1)에 등록하여 기존 핸들러와 독립적으로 동작
-        # UpdateFilter만 사용하면 MessageHandler 내부 2차 필터링에서 실패하므로
-        # filters.ALL을 사용하고 콜백에서 수정 여부를 직접 확인
         application.add_handler(
             MessageHandler(
-                filters.ALL,
+                filters.UpdateType.EDITED_MESSAGE
+                | filters.UpdateType.EDITED_CHANNEL_POST,
                 self.handle_edited_message,
             ),
             group=1,
@@ -5958,83 +6613,72 @@ class TelegramNotionBot:
         # 사진 메시지 (그룹 + 채널)
         application.add_handler(
             MessageHandler(
-                filters.PHOTO
-                & (
-                    filters.UpdateType.MESSAGE
-                    | filters.UpdateType.CHANNEL_POST
-                ),
+                filters.PHOTO & new_posts,
                 self.handle_photo_message,
+                # 느린 처리(사진 다운로드·노션 호출)가 다른 채팅을 막지 않도록
+                block=False,
             )
         )
 
         # 텍스트 전용 메시지 (그룹 + 채널, 명령어 제외)
         application.add_handler(
             MessageHandler(
-                filters.TEXT
-                & ~filters.COMMAND
-                & (
-                    filters.UpdateType.MESSAGE
-                    | filters.UpdateType.CHANNEL_POST
-                ),
+                filters.TEXT & ~filters.COMMAND & new_posts,
                 self.handle_text_message,
+                block=False,
             )
         )
 
-        logger.info("봇이 시작되었습니다...")
-        try:
-            print("🤖 봇이 시작되었습니다...")
-            print(
-                "텔레그램에서 사진과 매물 정보를 전송하면 "
-                "자동으로 노션에 등록됩니다."
-            )
-            print("📷 여러 장 사진 앨범도 지원됩니다!")
-            print(
-                "✏️ 원본 메시지를 수정하면 "
-                "노션에도 자동으로 반영됩니다!"
-            )
-            print(
-                "🗑️ 매물 메시지에 답장으로 /delete → "
-                "노션+텔레그램 모두 삭제!"
-            )
-            print(
-                "🔄 4시간마다 자동 동기화 "
-                "(삭제된 매물 노션에서 정리)"
-            )
-            print(
-                "/동기화 명령어로 수동 동기화를 "
-                "실행할 수 있습니다."
+        logger.info(
+            "봇이 시작되었습니다 - 사진/매물 자동 등록, 앨범 지원, "
+            "원본 수정 자동 반영, /delete 노션+텔레그램 삭제, "
+            "/동기화 수동 동기화"
+        )
+
+        # WEBHOOK_URL이 설정되면 웹훅 서버로 수신 (없으면 롱폴링)
+        webhook_base = os.environ.get("WEBHOOK_URL")
+        if webhook_base:
+            logger.info(f"웹훅 모드: {webhook_base}")
+            application.run_webhook(
+                listen="0.0.0.0",
+                port=int(os.environ.get("PORT", "8443")),
+                url_path=self.telegram_token,
+                webhook_url=f"{webhook_base.rstrip('/')}/{self.telegram_token}",
+                allowed_updates=self.ALLOWED_UPDATES,
             )
-        except UnicodeEncodeError:
-            print("[BOT] 봇이 시작되었습니다...")
-            print(
-                "텔레그램에서 사진과 매물 정보를 전송하면 "
-                "자동으로 노션에 등록됩니다."
+        else:
+            application.run_polling(
+                timeout=self.POLLING_TIMEOUT,
+                allowed_updates=self.ALLOWED_UPDATES,
             )
 
-        application.run_polling(allowed_updates=Update.ALL_TYPES)
-
 
 if __name__ == "__main__":
-    TELEGRAM_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
-    NOTION_TOKEN = os.getenv("NOTION_TOKEN")
-    DATABASE_ID = os.getenv("NOTION_DATABASE_ID")
-    # 선택: 개인용(관리자 전용) 노션 DB ID. 설정 시 공유 DB와 동시 기록.
-    PRIVATE_DATABASE_ID = os.getenv("PRIVATE_NOTION_DATABASE_ID") or None
-
-    if not all([TELEGRAM_TOKEN, NOTION_TOKEN, DATABASE_ID]):
+    required = {
+        name: os.environ.get(name)
+        for name in ("TELEGRAM_BOT_TOKEN", "NOTION_TOKEN", "NOTION_DATABASE_ID")
+    }
+    missing = [name for name, value in required.items() if not value]
+    if missing:
         print("=" * 50)
         print("환경변수를 설정해주세요!")
         print("=" * 50)
         print()
-        missing = []
-        if not TELEGRAM_TOKEN:
-            missing.append("TELEGRAM_BOT_TOKEN")
-        if not NOTION_TOKEN:
-            missing.append("NOTION_TOKEN")
-        if not DATABASE_ID:
-            missing.append("NOTION_DATABASE_ID")
         print(f"누락된 변수: {', '.join(missing)}")
-        exit(1)
+        raise SystemExit(1)
+
+    TELEGRAM_TOKEN = required["TELEGRAM_BOT_TOKEN"]
+    NOTION_TOKEN = required["NOTION_TOKEN"]
+    DATABASE_ID = required["NOTION_DATABASE_ID"]
+    # 선택: 개인용(관리자 전용) 노션 DB ID. 설정 시 공유 DB와 동시 기록.
+    PRIVATE_DATABASE_ID = os.environ.get("PRIVATE_NOTION_DATABASE_ID") or None
+
+    # --force-resync: 동기화 속성 확인 표시 파일 삭제 → 노션 속성 다시 확인
+    if "--force-resync" in sys.argv:
+        for db_id in (DATABASE_ID, PRIVATE_DATABASE_ID):
+            if db_id:
+                NotionUploader.sync_marker_path(db_id).unlink(missing_ok=True)
+        print("동기화 속성 재확인 모드 (--force-resync)")
 
     bot = TelegramNotionBot(
         TELEGRAM_TOKEN, NOTION_TOKEN, DATABASE_ID,